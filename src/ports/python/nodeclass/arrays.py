@@ -0,0 +1,242 @@
+"""
+Tree Arrays,
+flatten a tree into NumPy arrays for whole-tree statistics.
+
+The arrays are kept until the tree change, so repeated reports
+on the same tree don't walk the nodes again.
+
+NumPy is an optional dependency, it is imported only when used.
+
+- since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+from typing import Any
+from array import array
+
+from nodeclass.tree import TreeNode
+
+
+# -------------------------------------------------
+
+
+_SNAPSHOT_AGGREGATE: str = "_arrays_snapshot"
+
+
+def _import_numpy() -> Any:
+
+	try:
+		import numpy
+	except ImportError as error:
+		raise ImportError("The tree arrays require NumPy, install it with 'pip install numpy'.") from error
+
+	return numpy
+
+
+def _snapshot_token(root: "TreeNode") -> object:
+	"""
+	Get the value of the snapshot aggregate of root, the aggregate cache of the nodes forget it every time the subtree of root is changed.
+	"""
+
+	if ((_SNAPSHOT_AGGREGATE in root._aggregate_reducers) == False):
+		type(root).register_aggregate(_SNAPSHOT_AGGREGATE, lambda node: None, lambda value, values: object())
+
+	return root.get_aggregate(_SNAPSHOT_AGGREGATE)
+
+
+# -------------------------------------------------
+
+
+def to_arrays(root: "TreeNode") -> "TreeArrays":
+	"""
+	Flatten the subtree of root into NumPy arrays, the nodes are ordered in preorder so each subtree is a continuous range.
+
+	The result is cached and given again until a node of the subtree is added, removed, moved or renamed.
+
+	Params:
+		`root` (TreeNode): The top-level Node of the subtree, it has index 0.
+
+	Returns:
+		The arrays of the subtree, they are read-only.
+
+	- Since: 1.1
+	"""
+
+	token: object = _snapshot_token(root)
+
+	if (isinstance(token, TreeArrays) == True):
+		return token
+
+	# The snapshot replace the value of the aggregate, so it is kept by the root and dropped with the cache when the subtree change.
+	snapshot: TreeArrays = TreeArrays(root)
+	root._aggregate_cache[_SNAPSHOT_AGGREGATE] = snapshot
+	return snapshot
+
+
+# -------------------------------------------------
+
+
+class TreeArrays():
+	"""
+	The nodes of a subtree flattened into NumPy arrays, created by `to_arrays`.
+
+	Each array has one item for each node in preorder:
+	- parent: The index of the parent or -1 for the root.
+	- depth: The depth from the root, wich has depth 0.
+	- size: The amount of nodes inside the subtree of the node, itself included.
+	- child_count: The amount of childrens.
+	- name_id: The index of the name inside `names`.
+
+	The subtree of the node at index `i` is the range `i` to `i + size[i]`.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, root: "TreeNode") -> None:
+		numpy: Any = _import_numpy()
+		nodes: list[TreeNode] = []
+		parents: array = array("q")
+		depths: array = array("q")
+		child_counts: array = array("q")
+		name_ids: array = array("q")
+		names: dict[str, int] = {}
+		stack: list[tuple[TreeNode, int, int]] = [(root, -1, 0)]
+
+		while(len(stack) > 0):
+			node, parent, depth = stack.pop()
+			index: int = len(nodes)
+
+			nodes.append(node)
+			parents.append(parent)
+			depths.append(depth)
+			child_counts.append(len(node._childrens))
+			name_ids.append(names.setdefault(node._name, len(names)))
+
+			for child in reversed(node._childrens):
+				stack.append((child, index, depth + 1))
+
+		sizes: array = array("q", [1]) * len(nodes)
+
+		# In preorder every child is after his parent, so the sizes are summed from the end.
+		for index in range(len(nodes) - 1, 0, -1):
+			sizes[parents[index]] += sizes[index]
+
+		self.nodes: tuple[TreeNode] = tuple(nodes)
+		"""
+		The nodes in preorder.
+		"""
+
+		self.names: tuple[str] = tuple(names)
+		"""
+		The names used by the nodes, indexed by `name_id`.
+		"""
+
+		self.parent: Any = self._freeze(numpy, parents)
+		self.depth: Any = self._freeze(numpy, depths)
+		self.size: Any = self._freeze(numpy, sizes)
+		self.child_count: Any = self._freeze(numpy, child_counts)
+		self.name_id: Any = self._freeze(numpy, name_ids)
+
+
+	def __repr__(self) -> "str":
+		return "<{arrays_class}:{length}>".format(
+			arrays_class = type(self).__name__,
+			length = len(self.nodes)
+		)
+
+
+	def __len__(self) -> "int":
+		return len(self.nodes)
+
+
+	# -------------------------------------------------
+
+
+	def _freeze(self, numpy: Any, values: "array") -> Any:
+		result: Any = numpy.frombuffer(values, dtype = numpy.int64).copy()
+		result.flags.writeable = False
+		return result
+
+
+	# -------------------------------------------------
+
+
+	def depth_histogram(self) -> Any:
+		"""
+		Count the nodes at each depth.
+
+		Returns:
+			An array where the item at position `d` is the amount of nodes with depth `d`.
+
+		- Since: 1.1
+		"""
+
+		return _import_numpy().bincount(self.depth)
+
+
+	def subtree_sums(self, values: Any) -> Any:
+		"""
+		Sum a value of each node over the subtree of every node.
+
+		Params:
+			`values` (array): One value for each node in preorder, like `numpy.array([node.weight for node in arrays.nodes])`.
+
+		Returns:
+			An array where each item is the sum of the values of the subtree of the node, itself included.
+
+		- Since: 1.1
+		"""
+
+		numpy: Any = _import_numpy()
+		values = numpy.asarray(values)
+
+		if (values.shape != (len(self.nodes),)):
+			raise Exception("Expected {count} values instead of shape {shape}.".format(
+				count = len(self.nodes),
+				shape = values.shape
+			))
+
+		totals: Any = numpy.concatenate(([0], numpy.cumsum(values)))
+		starts: Any = numpy.arange(len(self.nodes))
+		return totals[starts + self.size] - totals[starts]
+
+
+	def leaves(self) -> Any:
+		"""
+		Get the index of the nodes without childrens.
+
+		- Since: 1.1
+		"""
+
+		return _import_numpy().flatnonzero(self.child_count == 0)
+
+
+	def level(self, depth: "int") -> Any:
+		"""
+		Get the index of the nodes with the input depth.
+
+		- Since: 1.1
+		"""
+
+		return _import_numpy().flatnonzero(self.depth == depth)
+
+
+	def select(self, indexes: Any) -> tuple["TreeNode"]:
+		"""
+		Convert the indexes given by the other methods back into nodes.
+
+		- Since: 1.1
+		"""
+
+		return tuple(self.nodes[index] for index in indexes)
+
+
+# -------------------------------------------------
+
@@ -11,7 +11,580 @@ ordered from a starting node to a final node.
 # -------------------------------------------------
 
 
-from typing import Union
+from typing import Callable, Union
+from weakref import ref as weak_ref
+from weakref import WeakValueDictionary
+
+
+# -------------------------------------------------
+
+
+CHAIN_BLOCK_SIZE: "int" = 512
+"""
+The amount of nodes a block of a `ChainOrder` can hold before being split.
+
+- Since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+def _get_weak_parent(node: "ChainNode") -> Union["ChainNode", None]:
+	reference = node._parent_ref
+	return None if (reference == None) else reference()
+
+
+def _set_weak_parent(node: "ChainNode", parent: Union["ChainNode", None]) -> None:
+	node._parent_ref = None if (parent == None) else weak_ref(parent)
+
+
+def _get_weak_chain(node: "ChainNode") -> "ChainHeader":
+	header: ChainHeader = node._chain_header
+
+	# The start of a weak chain is freed first when the chain is dropped,
+	# if the current node survived the chain has lost his upstream and must be described again.
+	if (header.start == None):
+		start: ChainNode = node
+
+		while(start._parent != None):
+			start = start._parent
+
+		header = _describe_chain(start)
+	
+	return header
+
+
+def _set_weak_chain(node: "ChainNode", header: "ChainHeader") -> None:
+	node._chain_header = header
+
+
+def _describe_chain(start: "ChainNode", source: "ChainHeader" = None) -> "ChainHeader":
+	"""
+	Create a new header for the chain beginning at `start` and assign it to all of his nodes.
+
+	If `source` is used the names of the nodes are removed from it.
+	"""
+
+	header: ChainHeader = type(start)._header_type(start)
+	node: ChainNode = start
+	length: int = 0
+
+	while(node != None):
+
+		if (source != None):
+			del source.names[node._name]
+
+		node._chain = header
+		header.names[node._name] = node
+		header.end = node
+		length += 1
+		node = node._child
+
+	header.length = length
+	return header
+
+
+def _split_chain(parent: "ChainNode", child: "ChainNode") -> None:
+	"""
+	Give a new header to the shortest side of the chain that is going to be cut between `parent` and `child`.
+	"""
+
+	header: ChainHeader = parent._chain
+	up: ChainNode = parent
+	down: ChainNode = child
+
+	# Walk both sides at the same time, the first to reach his end is the shortest.
+	while(True):
+		up = up._parent
+
+		if (up == None):
+			side: ChainHeader = type(header.start)._header_type(header.start)
+			side.end = parent
+			side.length = 0
+			node: ChainNode = parent
+
+			while(node != None):
+				del header.names[node._name]
+				node._chain = side
+				side.names[node._name] = node
+				side.length += 1
+				node = node._parent
+
+			# The moved side is indexed again only if a position is requested.
+			if (header.order != None):
+				header.order.remove(header.start, side.length)
+
+			header.start = child
+			break
+
+		down = down._child
+
+		if (down == None):
+			side: ChainHeader = _describe_chain(child, header)
+			header.end = parent
+
+			if (header.order != None):
+				header.order.remove(child, side.length)
+
+			break
+
+	header.length -= side.length
+
+
+def _unique_name(header: "ChainHeader", name: "str") -> "str":
+	"""
+	Find a name not used inside the chain of `header`, a counter is added to `name` if it is already used.
+	"""
+
+	if ((name in header.names) == False):
+		return name
+
+	count: int = header.counters.get(name, 0)
+
+	while(True):
+		count += 1
+		fix_name: str = f"{name}{count}"
+
+		if ((fix_name in header.names) == False):
+			break
+
+	header.counters[name] = count
+	return fix_name
+
+
+def _merge_chain(header: "ChainHeader", first: "ChainNode", after: Union["ChainNode", None]) -> "ChainNode":
+	"""
+	Move the nodes from `first` to the end of his chain inside `header`, only the moved nodes are renamed if their name is already used.
+
+	The connections between the nodes are not changed, the moved nodes are indexed after the node `after`, or at the start if it is `None`.
+
+	Returns the last moved node.
+	"""
+
+	moved: Union[list, None] = None if (header.order == None) else []
+	conflicts: list[ChainNode] = []
+	node: ChainNode = first
+	last: ChainNode = first
+
+	while(node != None):
+		node._chain = header
+
+		if (node._name in header.names):
+			conflicts.append(node)
+		else:
+			header.names[node._name] = node
+
+		if (moved != None):
+			moved.append(node)
+
+		header.length += 1
+		last = node
+		node = node._child
+
+	if (moved != None):
+		header.order.insert(after, moved)
+
+	for node in conflicts:
+		node._name = _unique_name(header, node._name)
+		header.names[node._name] = node
+
+	return last
+
+
+def _cut_chain(first: "ChainNode", last: "ChainNode") -> None:
+	"""
+	Disconnect the nodes from `first` to `last` from their chain and give them a new header,
+	the nodes before and after them are connected together.
+	"""
+
+	header: ChainHeader = first._chain
+	parent: ChainNode = first._parent
+	child: ChainNode = last._child
+
+	if ((parent == None) and (child == None)):
+		return
+
+	side: ChainHeader = type(first)._header_type(first)
+	side.length = 0
+	node: ChainNode = first
+
+	while(True):
+		del header.names[node._name]
+		node._chain = side
+		side.names[node._name] = node
+		side.length += 1
+
+		if (node == last):
+			break
+
+		node = node._child
+	
+	side.end = last
+	header.length -= side.length
+
+	if (header.order != None):
+		header.order.remove(first, side.length)
+
+	if (child == None):
+		header.end = parent
+	else:
+		child._parent = parent
+
+	if (parent == None):
+		header.start = child
+	else:
+		parent._child = child
+
+	first._parent = None
+	last._child = None
+
+
+def _load_chain(classes: tuple[type], kinds: list[int], names: list[str]) -> "ChainNode":
+	"""
+	Rebuild a chain encoded by `ChainNode.__reduce__` and return the start.
+	"""
+
+	start: Union[ChainNode, None] = None
+	parent: Union[ChainNode, None] = None
+
+	# The nodes are connected directly, a single header is given to all of them at the end.
+	for kind, name in zip(kinds, names):
+		node: ChainNode = classes[kind].__new__(classes[kind])
+		node._parent = parent
+		node._child = None
+		node._name = name
+
+		if (parent == None):
+			start = node
+		else:
+			parent._child = node
+
+		parent = node
+
+	_describe_chain(start)
+	return start
+
+
+def _find_chain_node(start: "ChainNode", index: "int") -> "ChainNode":
+	"""
+	Get the node of a chain rebuilt by `_load_chain` from his index position.
+	"""
+
+	return start.get_node(index)
+
+
+def _index_chain(header: "ChainHeader") -> "ChainOrder":
+	"""
+	Give the index of the positions of the chain of `header`, it is built in a single pass the first time it is requested.
+	"""
+
+	if (header.order == None):
+		nodes: list[ChainNode] = []
+		node: Union[ChainNode, None] = header.start
+
+		while(node != None):
+			nodes.append(node)
+			node = node._child
+
+		header.order = ChainOrder(type(header)._store, type(header)._load, nodes)
+
+	return header.order
+
+
+# -------------------------------------------------
+
+
+class _ChainBlock():
+	"""
+	A block of consecutive nodes inside a `ChainOrder`, each node reference his block.
+	"""
+
+	__slots__ = ("items", "number")
+
+
+	def __init__(self, items: "list") -> None:
+		self.items: list = items
+		self.number: int = 0
+
+
+class ChainOrder():
+	"""
+	The index of the positions of the nodes of a chain, kept by the `ChainHeader` and updated by every change of the chain.
+
+	The nodes are stored inside blocks and the size of each block is kept inside a Fenwick tree,
+	so the position of a node and the node at a position are found in logarithmic time plus the search inside a single block,
+	and inserting or removing nodes only shift the nodes of the blocks they touch.
+
+	You should never edit it directly.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, store: Callable, load: Callable, nodes: "list[ChainNode]") -> None:
+		self._store: Callable = store
+		self._load: Callable = load
+		self._blocks: list[_ChainBlock] = []
+		self._fill(self._blocks, 0, nodes)
+		self._index_blocks()
+
+
+	def __len__(self) -> "int":
+		return self._prefix(len(self._blocks))
+
+
+	# -------------------------------------------------
+
+
+	def _fill(self, blocks: "list[_ChainBlock]", number: "int", nodes: "list[ChainNode]") -> None:
+		"""
+		Store the nodes inside new blocks, inserted at position number of blocks.
+		"""
+
+		size: int = CHAIN_BLOCK_SIZE
+		created: list[_ChainBlock] = []
+
+		for n in range(0, len(nodes), size):
+			block: _ChainBlock = _ChainBlock([self._store(node) for node in nodes[n:n + size]])
+
+			for node in nodes[n:n + size]:
+				node._block = block
+
+			created.append(block)
+
+		blocks[number:number] = created or ([_ChainBlock([])] if (len(blocks) == 0) else [])
+
+
+	def _index_blocks(self) -> None:
+		"""
+		Rebuild the number of each block and the Fenwick tree of their sizes.
+		"""
+
+		count: int = len(self._blocks)
+		sizes: list[int] = [0] * (count + 1)
+
+		for n in range(1, count + 1):
+			self._blocks[n - 1].number = n - 1
+			sizes[n] += len(self._blocks[n - 1].items)
+			parent: int = n + (n & -n)
+
+			if (parent <= count):
+				sizes[parent] += sizes[n]
+
+		self._sizes: list[int] = sizes
+		self._step: int = 1 << (count.bit_length() - 1)
+
+
+	def _add(self, block: "int", amount: "int") -> None:
+		block += 1
+
+		while(block < len(self._sizes)):
+			self._sizes[block] += amount
+			block += block & -block
+
+
+	def _prefix(self, block: "int") -> "int":
+		total: int = 0
+
+		while(block > 0):
+			total += self._sizes[block]
+			block -= block & -block
+
+		return total
+
+
+	def _offset(self, node: "ChainNode") -> "int":
+		return node._block.items.index(self._store(node))
+
+
+	# -------------------------------------------------
+
+
+	def position(self, node: "ChainNode") -> "int":
+		"""
+		Get the index position of a node of the chain.
+
+		- Since: 1.1
+		"""
+
+		return self._prefix(node._block.number) + self._offset(node)
+
+
+	def node_at(self, index: "int") -> "ChainNode":
+		"""
+		Get the node at a valid index position.
+
+		- Since: 1.1
+		"""
+
+		block: int = 0
+		step: int = self._step
+		count: int = len(self._sizes) - 1
+
+		while(step > 0):
+
+			if ((block + step <= count) and (self._sizes[block + step] <= index)):
+				block += step
+				index -= self._sizes[block]
+
+			step >>= 1
+
+		return self._load(self._blocks[block].items[index])
+
+
+	def insert(self, after: Union["ChainNode", None], nodes: "list[ChainNode]") -> None:
+		"""
+		Insert consecutive nodes after the node `after`, or at the start if it is `None`.
+
+		- Since: 1.1
+		"""
+
+		if (after == None):
+			block: _ChainBlock = self._blocks[0]
+			offset: int = 0
+		else:
+			block = after._block
+			offset = self._offset(after) + 1
+
+		block.items[offset:offset] = [self._store(node) for node in nodes]
+
+		for node in nodes:
+			node._block = block
+
+		if (len(block.items) > CHAIN_BLOCK_SIZE * 2):
+			number: int = block.number
+			del self._blocks[number]
+			self._fill(self._blocks, number, [self._load(item) for item in block.items])
+			self._index_blocks()
+		else:
+			self._add(block.number, len(nodes))
+
+
+	def remove(self, first: "ChainNode", count: "int") -> None:
+		"""
+		Remove an amount of consecutive nodes starting from first.
+
+		- Since: 1.1
+		"""
+
+		number: int = first._block.number
+		offset: int = self._offset(first)
+		emptied: bool = False
+
+		while(count > 0):
+			items: list = self._blocks[number].items
+			size: int = min(count, len(items) - offset)
+			del items[offset:offset + size]
+			self._add(number, -size)
+			emptied = emptied or (len(items) == 0)
+			count -= size
+			offset = 0
+			number += 1
+
+		if ((emptied == True) and (len(self._blocks) > 1)):
+			self._blocks = [block for block in self._blocks if (len(block.items) > 0)] or [_ChainBlock([])]
+			self._index_blocks()
+
+
+# -------------------------------------------------
+
+
+class ChainHeader():
+	"""
+	A descriptor shared by every node of the same chain, it keep track of the start, the end and the length of the whole chain.
+
+	It is updated when chains are connected or disconnected, you should never edit it directly.
+
+	- Since: 1.1
+	"""
+
+	_names_type: type = dict
+
+	def __init__(self, start: "ChainNode") -> None:
+
+		self.start: ChainNode = start
+		"""
+		The first node of the chain.
+		"""
+
+		self.end: ChainNode = start
+		"""
+		The last node of the chain.
+		"""
+
+		self.length: int = 1
+		"""
+		The amount of nodes inside the chain.
+		"""
+
+		self.names: dict[str, ChainNode] = self._names_type()
+		"""
+		The node of the chain that use each name.
+		"""
+
+		self.counters: dict[str, int] = {}
+		"""
+		The last counter used to make unique each base name.
+		"""
+
+		self.order: Union[ChainOrder, None] = None
+		"""
+		The index of the positions of the nodes, `None` until a position is requested.
+		"""
+
+		self.names[start._name] = start
+
+
+	@staticmethod
+	def _store(node: "ChainNode") -> "ChainNode":
+		"""
+		Convert a node into the item stored inside `order`.
+		"""
+
+		return node
+
+
+	@staticmethod
+	def _load(item: "ChainNode") -> "ChainNode":
+		"""
+		Convert an item stored inside `order` back into a node.
+		"""
+
+		return item
+
+
+class WeakChainHeader(ChainHeader):
+	"""
+	A `ChainHeader` wich store the nodes as weak references, used by nodes with weak parents so the header never keep the chain alive.
+
+	- Since: 1.1
+	"""
+
+	_names_type: type = WeakValueDictionary
+
+	start = property(
+		lambda self: self._start_ref(),
+		lambda self, node: setattr(self, "_start_ref", weak_ref(node))
+	)
+
+	end = property(
+		lambda self: self._end_ref(),
+		lambda self, node: setattr(self, "_end_ref", weak_ref(node))
+	)
+
+
+	@staticmethod
+	def _store(node: "ChainNode") -> "ChainNode":
+		return weak_ref(node)
+
+
+	@staticmethod
+	def _load(item: "ChainNode") -> "ChainNode":
+		return item()
 
 
 # -------------------------------------------------
@@ -29,6 +602,17 @@ class ChainNode():
 	"""
 
 
+	_header_type: type = ChainHeader
+	"""
+	The class of the header created for a new chain.
+	"""
+
+	_structure_keys: frozenset[str] = frozenset(("_parent", "_parent_ref", "_child", "_name", "_chain", "_chain_header", "_block"))
+	"""
+	The attributes that describe the connections of a Node, they are not copied as extra state when the chain is pickled.
+	"""
+
+
 	# -------------------------------------------------
 	
 
@@ -36,16 +620,92 @@ class ChainNode():
 		self._parent: ChainNode = None
 		self._child: ChainNode = None
 		self._name: str = name
+		self._chain: ChainHeader = self._header_type(self)
+
+
+	def __init_subclass__(cls, weak_parent: "bool" = None, **kwargs) -> None:
+		"""
+		Allow a subclass to choose how the parent reference is stored, `class MyNode(ChainNode, weak_parent = True)`.
+
+		The nodes keep a weak reference to their parent, so the chain is owned by the start and dropping the start free the whole structure without the cyclic garbage collector.
+
+		Params:
+			`weak_parent` (bool): If enabled the parent is stored as a weak reference, if disabled as a normal reference, by default it is inherited.
+
+		- Since: 1.1
+		"""
+
+		super().__init_subclass__(**kwargs)
+
+		if (weak_parent == True):
+			cls._parent = property(_get_weak_parent, _set_weak_parent)
+			cls._chain = property(_get_weak_chain, _set_weak_chain)
+			cls._header_type = WeakChainHeader
+		elif (weak_parent == False):
+			cls._parent = None
+			cls._chain = None
+			cls._header_type = ChainHeader
 
 
 	def __repr__(self) -> "str":
 		return self.repr()
 	
 
+	def __reduce__(self) -> "tuple":
+		"""
+		Allow `pickle` and `copy` to save the whole chain of the current Node without recursion.
+
+		The start is encoded as flat lists of classes and names,
+		the attributes added by subclasses are saved as extra state of each node.
+
+		Any other Node is encoded as the start and his index position, so a chain is stored only once.
+
+		- Since: 1.1
+		"""
+
+		start: ChainNode = self._chain.start
+
+		if (start != self):
+			return (_find_chain_node, (start, self.get_index()))
+
+		classes: dict[type, int] = {}
+		kinds: list[int] = []
+		names: list[str] = []
+		states: dict[int, dict] = {}
+		node: ChainNode = self
+
+		while(node != None):
+			if ((node.__dict__.keys() <= node._structure_keys) == False):
+				states[len(names)] = {key: value for key, value in node.__dict__.items() if ((key in node._structure_keys) == False)}
+
+			kinds.append(classes.setdefault(type(node), len(classes)))
+			names.append(node._name)
+			node = node._child
+
+		return (_load_chain, (tuple(classes), kinds, names), states if (len(states) > 0) else None)
+
+
+	def __setstate__(self, states: dict[int, dict]) -> None:
+		"""
+		Restore the extra state of the nodes of a chain loaded by `pickle` or `copy`.
+
+		- Since: 1.1
+		"""
+
+		for index, extra in states.items():
+			self.get_node(index).__dict__.update(extra)
+	
+
 	def __iter__(self) -> "ChainNode":
+		return self.iter_forward()
+
 
-		for child in self.get_path(to_end = True):
-			yield child
+	def __reversed__(self) -> "ChainNode":
+		current: ChainNode = self._chain.end
+
+		while(current != self):
+			yield current
+			current = current._parent
 
 
 	# -------------------------------------------------
@@ -73,6 +733,19 @@ class ChainNode():
 		return self._child
 	
 
+	@property
+	def chain(self) -> "ChainHeader":
+		"""
+		The header shared by all the nodes of the current chain.
+
+		The property is stored as `_chain`, if you edit it directly it may cause desync between Nodes.
+
+		- since: 1.1
+		"""
+
+		return self._chain
+
+
 	@property
 	def name(self) -> "str":
 		"""
@@ -133,55 +806,59 @@ class ChainNode():
 		Will help you to remove all references of the current Node from any connection.
 
 		Here the order of what will happen when executed:
-		1. Will first execute the same method to all childrens, make sure to remove them before executing this method if you wish to keep them.
+		1. Will first free all the following nodes, starting from the end of the chain and moving back to the current Node, make sure to remove them before executing this method if you wish to keep them.
 		2. Will execute the `_free` virtual.
 		3. Will disconnect from the parent.
+
+		Each node is freed exactly once in a single pass, only the `_free`, `_child_changed` and `_parent_changed` virtuals of the disconnected nodes are executed.
 		
 		After that you can destroy the object with no problem.
 		- Since: 1.0
 		"""
 		
-		for c in self.get_path(to_end = True):
-			c.free()
+		node: ChainNode = self._chain.end
 
-		self._free()
+		while(True):
+			node._free()
+			parent: ChainNode = node._parent
 
-		if (self._parent != None):
-			self._parent.remove_child()
+			if (parent == None):
+				break
+
+			parent.remove_child()
+
+			if (node == self):
+				break
+
+			node = parent
 
 
-	# TODO:
-	# Rename ignore the first element (get_start) becaus is ignored in get_path.
-	# All ports have same problem.
 	def rename(self, name: "str") -> None:
-		new_name: str = name
-		count: int = 0
+		"""
+		Will change the name of the current node.
 
-		while(True):
-			found: bool = False
-
-			for n in self.get_start().get_path(to_end = True):
-
-				if ((n != self) and (n._name == new_name)):
-					found = True
-					break
-			
-			if (found == True):
-				count += 1
-				new_name = f"{name}{count}"
-			else:
-				name = new_name
-				break
+		If the name is already used by another node of the chain a counter is used to find a new unique name.
+
+		Params:
+			`name` str: The new desired name.
+
+		- Since: 1.0
+		"""
 
+		header: ChainHeader = self._chain
 
-		self._name = name
+		if (header.names.get(self._name) == self):
+			del header.names[self._name]
+
+		self._name = _unique_name(header, name)
+		header.names[self._name] = self
 
 
 	def add_child(self, node: "ChainNode") -> None:
 		"""
-		Connect node as a child of the current Node.
+		Connect node as a child of the current Node, the chain of the node is joined to the chain of the current Node.
 
-		If a child already exist, an exception is raised.
+		If a child already exist, the node already has a parent or the node is part of the same chain, an exception is raised.
 
 		- Since: 1.0
 		"""
@@ -193,14 +870,349 @@ class ChainNode():
 
 		if (self._child != None):
 			raise Exception("Another child is already connected to this Node.")
+
+		if (node._parent != None):
+			raise Exception("Tried to add as a child a Node already connected to a parent.")
 		
+		header: ChainHeader = self._chain
+		other: ChainHeader = node._chain
+
+		if (other == header):
+			raise Exception("You can't connect a Node with his own chain.")
+
+		# Only the shortest chain is relabeled with the header of the other,
+		# the nodes of the connected chain are the ones renamed when a name is already used.
+		if (other.length <= header.length):
+			header.end = _merge_chain(header, node, self)
+		else:
+			conflicts: list[ChainNode] = []
+			moved: list[ChainNode] = []
+			current: ChainNode = self
+
+			while(current != None):
+				current._chain = other
+				moved.append(current)
+
+				if (current._name in other.names):
+					conflicts.append(other.names[current._name])
+
+				other.names[current._name] = current
+				current = current._parent
+
+			for current in conflicts:
+				current._name = _unique_name(other, current._name)
+				other.names[current._name] = current
+
+			other.start = header.start
+			other.length += header.length
+
+			if (other.order != None):
+				moved.reverse()
+				other.order.insert(None, moved)
+
 		node._parent = self
 		self._child = node
-		node.rename(node._name)	# Make sure to update name.
 		node._parent_changed()
 		self._child_changed()
 
 
+	def insert_after(self, node: "ChainNode") -> None:
+		"""
+		Insert the chain of node between the current Node and his child, the node must be the start of his chain.
+
+		Only the inserted nodes are renamed if their name is already used.
+
+		If the node has a parent or is part of the same chain, an exception is raised.
+
+		Params:
+			`node` ChainNode: The start of the chain to insert.
+
+		- Since: 1.1
+		"""
+
+		if (isinstance(node, ChainNode) == False):
+			raise Exception("Tried to insert '{type_name}' in the chain.".format(
+				type_name = type(node).__name__
+			))
+
+		if (node._parent != None):
+			raise Exception("Tried to insert a Node already connected to a parent.")
+
+		if (node._chain == self._chain):
+			raise Exception("You can't connect a Node with his own chain.")
+
+		header: ChainHeader = self._chain
+		child: ChainNode = self._child
+
+		last: ChainNode = _merge_chain(header, node, self)
+		self._child = node
+		node._parent = self
+		last._child = child
+
+		if (child == None):
+			header.end = last
+		else:
+			child._parent = last
+
+		node._parent_changed()
+		self._child_changed()
+
+		if (child != None):
+			last._child_changed()
+			child._parent_changed()
+
+
+	def insert_before(self, node: "ChainNode") -> None:
+		"""
+		Insert the chain of node between the current Node and his parent, the node must be the start of his chain.
+
+		If the current Node is the start of the chain the inserted chain become the new start.
+
+		Only the inserted nodes are renamed if their name is already used.
+
+		If the node has a parent or is part of the same chain, an exception is raised.
+
+		Params:
+			`node` ChainNode: The start of the chain to insert.
+
+		- Since: 1.1
+		"""
+
+		if (self._parent != None):
+			self._parent.insert_after(node)
+			return
+
+		if (isinstance(node, ChainNode) == False):
+			raise Exception("Tried to insert '{type_name}' in the chain.".format(
+				type_name = type(node).__name__
+			))
+
+		if (node._parent != None):
+			raise Exception("Tried to insert a Node already connected to a parent.")
+
+		if (node._chain == self._chain):
+			raise Exception("You can't connect a Node with his own chain.")
+
+		header: ChainHeader = self._chain
+		last: ChainNode = _merge_chain(header, node, None)
+		header.start = node
+		last._child = self
+		self._parent = last
+		last._child_changed()
+		self._parent_changed()
+
+
+	def split_at(self, node: "ChainNode") -> "ChainNode":
+		"""
+		Cut the chain of the current Node before node, node become the start of a new chain.
+
+		If node is not part of the same chain, an exception is raised.
+
+		Params:
+			`node` ChainNode: The first node of the new chain.
+
+		Returns:
+			The node given.
+
+		- Since: 1.1
+		"""
+
+		if ((isinstance(node, ChainNode) == False) or (node._chain != self._chain)):
+			raise Exception("Tried to split the chain at a Node wich isn't part of the chain.")
+
+		if (node._parent != None):
+			node.remove_parent()
+
+		return node
+
+
+	def concat(self, other: "ChainNode") -> None:
+		"""
+		Connect the whole chain of other after the end of the chain of the current Node.
+
+		If other is part of the same chain, an exception is raised.
+
+		Params:
+			`other` ChainNode: Any node of the chain to connect.
+
+		- Since: 1.1
+		"""
+
+		if (isinstance(other, ChainNode) == False):
+			raise Exception("Tried to add '{type_name}' as a child.".format(
+				type_name = type(other).__name__
+			))
+
+		self._chain.end.add_child(other._chain.start)
+
+
+	def splice(self, sub_start: "ChainNode", sub_end: "ChainNode") -> None:
+		"""
+		Move the nodes from sub_start to sub_end, from any chain, between the current Node and his child.
+
+		The nodes around the moved ones are connected together, only the moved nodes are renamed if their name is already used.
+
+		If sub_end does not follow sub_start or the current Node is between them, an exception is raised.
+
+		Params:
+			`sub_start` ChainNode: The first node to move.
+			`sub_end` ChainNode: The last node to move.
+
+		- Since: 1.1
+		"""
+
+		if ((isinstance(sub_start, ChainNode) == False) or (isinstance(sub_end, ChainNode) == False)):
+			raise Exception("Tried to splice '{start_name}' and '{end_name}' in the chain.".format(
+				start_name = type(sub_start).__name__,
+				end_name = type(sub_end).__name__
+			))
+
+		node: ChainNode = sub_start
+
+		while(True):
+
+			if (node == self):
+				raise Exception("You can't splice a Node inside his own range.")
+
+			if (node == sub_end):
+				break
+
+			node = node._child
+
+			if (node == None):
+				raise Exception("The end of the range does not follow the start.")
+
+		parent: ChainNode = sub_start._parent
+		child: ChainNode = sub_end._child
+
+		_cut_chain(sub_start, sub_end)
+
+		if (parent != None):
+			parent._child_changed()
+
+		if (child != None):
+			child._parent_changed()
+
+			if (self._child == None):
+				sub_end._child_changed()
+
+		self.insert_after(sub_start)
+
+
+	@classmethod
+	def from_iterable(cls, items) -> Union["ChainNode", None]:
+		"""
+		Build a new chain from an iterable of names or unconnected nodes, a name is converted into a node of the current class.
+
+		The nodes are connected in a single pass, see `extend`.
+
+		Params:
+			`items` (iterable): The names or nodes from the start to the end of the chain.
+
+		Returns:
+			The start of the chain or `None` if the iterable is empty.
+
+		- Since: 1.1
+		"""
+
+		items = iter(items)
+
+		for item in items:
+			start: ChainNode = cls(item) if (isinstance(item, str) == True) else item
+
+			if (isinstance(start, ChainNode) == False):
+				raise Exception("Tried to add '{type_name}' in the chain.".format(
+					type_name = type(start).__name__
+				))
+
+			if ((start._parent != None) or (start._child != None)):
+				raise Exception("Tried to add a Node already connected to other nodes.")
+
+			start.extend(items)
+			return start
+
+		return None
+
+
+	def extend(self, items) -> None:
+		"""
+		Add names or unconnected nodes after the end of the chain of the current Node, a name is converted into a node of the same class of the current Node.
+
+		All the nodes are connected in a single pass and their names are made unique with the name index of the chain,
+		the virtual methods are executed once for each node after all of them are connected.
+
+		If an item is not a name or a node, or the node is already connected, an exception is raised and the nodes added before it are kept.
+
+		Params:
+			`items` (iterable): The names or nodes to add.
+
+		- Since: 1.1
+		"""
+
+		header: ChainHeader = self._chain
+		names: dict[str, ChainNode] = header.names
+		added: Union[list, None] = None if (header.order == None) else []
+		node_type: type = type(self)
+		parent: ChainNode = header.end
+		first: ChainNode = parent
+		length: int = header.length
+
+		# Nodes created from names skip the header of their own when the class does not change the constructor.
+		fast: bool = (node_type.__init__ == ChainNode.__init__)
+
+		try:
+
+			for item in items:
+
+				if (isinstance(item, str) == True):
+
+					if (fast == True):
+						node: ChainNode = node_type.__new__(node_type)
+						node._child = None
+						node._name = item
+					else:
+						node = node_type(item)
+
+				elif (isinstance(item, ChainNode) == True):
+					node = item
+
+					if ((node._parent != None) or (node._child != None) or (node._chain == header)):
+						raise Exception("Tried to add a Node already connected to other nodes.")
+
+				else:
+					raise Exception("Tried to add '{type_name}' in the chain.".format(
+						type_name = type(item).__name__
+					))
+
+				if (node._name in names):
+					node._name = _unique_name(header, node._name)
+
+				names[node._name] = node
+				node._chain = header
+				node._parent = parent
+				parent._child = node
+
+				if (added != None):
+					added.append(node)
+
+				length += 1
+				parent = node
+
+		finally:
+			header.end = parent
+			header.length = length
+
+			if ((added != None) and (len(added) > 0)):
+				header.order.insert(first, added)
+
+			node = first
+
+			while(node != parent):
+				node._child_changed()
+				node = node._child
+				node._parent_changed()
+
+
 	def remove_parent(self) -> None:
 		"""
 		Disconnect the current Node from his parent.
@@ -213,6 +1225,7 @@ class ChainNode():
 		
 		parent = self._parent
 
+		_split_chain(parent, self)
 		self._parent = None
 		parent._child = None
 		self._parent_changed()
@@ -231,6 +1244,7 @@ class ChainNode():
 		
 		child = self._child
 
+		_split_chain(self, child)
 		self._child = None
 		child._parent = None
 		self._child_changed()
@@ -244,20 +1258,42 @@ class ChainNode():
 		"""
 		Get the index position inside the chain from the start to the current position.
 
+		The positions of the chain are indexed the first time they are requested and then kept updated by every change,
+		so a position is found in logarithmic time, see `ChainOrder`.
+
 		Returns:
 			Integer of the current position, it will start from 0.
 		
 		- Since: 1.0
 		"""
 
-		index: int = 0
-		current: ChainNode = self
+		return _index_chain(self._chain).position(self)
 
-		while(current._parent != None):
-			index += 1
-			current = current._parent
-		
-		return index
+
+	def get_node(self, index: "int") -> Union["ChainNode", None]:
+		"""
+		Get a node by his index position inside the whole chain.
+
+		Positive numbers will get the node from the start to the end and negative numbers will get the node from the end to the start.
+
+		Params:
+			`index` int: The index position of the node.
+
+		Returns:
+			The found node or `None` if the index is outside of the chain.
+
+		- Since: 1.1
+		"""
+
+		header: ChainHeader = self._chain
+
+		if (index < 0):
+			index += header.length
+
+		if ((index < 0) or (index >= header.length)):
+			return None
+
+		return _index_chain(header).node_at(index)
 
 
 	def get_start(self) -> "ChainNode":
@@ -270,12 +1306,7 @@ class ChainNode():
 		- Since: 1.0
 		"""
 
-		node: ChainNode = self
-
-		while(node._parent != None):
-			node = node._parent
-		
-		return node
+		return self._chain.start
 	
 
 	def get_end(self) -> "ChainNode":
@@ -288,12 +1319,22 @@ class ChainNode():
 		- Since: 1.0
 		"""
 
-		node: ChainNode = self
+		return self._chain.end
 
-		while(node._child != None):
-			node = node._child
-		
-		return node
+
+	def get_length(self) -> "int":
+		"""
+		The amount of nodes of the whole chain structure, the current Node included.
+
+		The iteration of a Node give only the nodes after it, so this is not the same as `len(list(node))`.
+
+		Returns:
+			The length of the chain, at least 1.
+
+		- Since: 1.1
+		"""
+
+		return self._chain.length
 
 	
 	def get_chain(self, index: Union["int", "str"]) -> Union["ChainNode", None]:
@@ -302,9 +1343,9 @@ class ChainNode():
 
 		If index is a positive number the function return a node forward from the current node.
 		
-		If index is a negative number the function return a node forward from the current node.
+		If index is a negative number the function return a node backward from the current node.
 
-		If index is a string the function return the only node he can find in the whole chain with that name.
+		If index is a string the function return the only node he can find in the whole chain with that name, or `None` if no node use it.
 
 		- Since: 1.0
 		"""
@@ -312,32 +1353,15 @@ class ChainNode():
 		node: ChainNode = self
 
 		if (isinstance(index, int) == True):
+			index += self.get_index()
 
-			if (index >= 0):
-
-				for n in range(index):
-
-					if (node._child != None):
-						node = node._child
-					else:
-						return None
-			else:
-				index = -index
-
-				for n in range(index):
+			if ((index < 0) or (index >= self._chain.length)):
+				return None
 
-					if (node._parent != None):
-						node = node._parent
-					else:
-						return None
+			node = self.get_node(index)
 		
 		elif (isinstance(index, str) == True):
-
-			for n in self.get_start().get_path(to_end = True):
-
-				if (n._name == index):
-					node = n
-					break
+			node = self._chain.names.get(index)
 
 		else:
 			raise Exception("Invalid type '{type}' used in index.".format(
@@ -357,24 +1381,61 @@ class ChainNode():
 		- Since: 1.0
 		"""
 
-		path: tuple[ChainNode] = ()
-		current: ChainNode = None
+		return tuple(self.iter_forward() if (to_end == True) else self.iter_backward())
 
-		if (to_end == False):
-			current = self._parent
-			
-			while(current != None):
-				path = (*path, current)
-				current = current._parent
-		
-		else:
-			current = self._child
-			
-			while(current != None):
-				path = (*path, current)
-				current = current._child
 
-		return path
+	def iter_forward(self) -> "ChainNode":
+		"""
+		Lazily iterate the nodes from the child of the current Node to the last Node.
+
+		- Since: 1.1
+		"""
+
+		current: ChainNode = self._child
+
+		while(current != None):
+			yield current
+			current = current._child
+
+
+	def iter_backward(self) -> "ChainNode":
+		"""
+		Lazily iterate the nodes from the parent of the current Node to the first Node.
+
+		- Since: 1.1
+		"""
+
+		current: ChainNode = self._parent
+
+		while(current != None):
+			yield current
+			current = current._parent
+
+
+	def iter_range(self, start: "int", stop: Union["int", None] = None) -> "ChainNode":
+		"""
+		Lazily iterate the nodes of the whole chain from the index position start to stop, like a slice the stop position is excluded.
+
+		Negative numbers are positions from the end of the chain.
+
+		Params:
+			`start` int: The index position of the first node.
+			`stop` int: Optional index position where the iteration end, by default the end of the chain.
+
+		- Since: 1.1
+		"""
+
+		length: int = self._chain.length
+		start, stop, step = slice(start, stop).indices(length)
+
+		if (start >= stop):
+			return
+
+		current: ChainNode = self.get_node(start)
+
+		for n in range(stop - start):
+			yield current
+			current = current._child
 
 
 	def repr(self) -> "str":
@@ -417,3 +1478,16 @@ class ChainNode():
 
 # -------------------------------------------------
 
+
+class WeakChainNode(ChainNode, weak_parent = True):
+	"""
+	A `ChainNode` wich store the parent as a weak reference, see `ChainNode.__init_subclass__`.
+
+	- Since: 1.1
+	"""
+
+	pass
+
+
+# -------------------------------------------------
+
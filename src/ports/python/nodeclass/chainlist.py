@@ -0,0 +1,474 @@
+"""
+Chain List,
+keep nodes in a recency order with constant time operations.
+
+The list is the header of the chain of his nodes, so a node can be
+moved from any position to the end without walking the chain.
+
+- since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+from typing import Any, Iterable, Union
+
+from nodeclass.chain import ChainNode, ChainHeader
+
+
+# -------------------------------------------------
+
+
+class ChainList(ChainHeader):
+	"""
+	A chain of nodes that track his head and tail, each node is found by his name wich is used as a key.
+
+	Names are not made unique with a counter, adding a node with a name already used is an error, so every operation is constant time:
+	`append`, `remove`, `move_to_end`, `pop_front`, `pop` and `get`.
+
+	The list is the header shared by his nodes, so `get_start`, `get_end`, `get_length`, `get_index` and the iteration of each node keep working.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, nodes: Iterable["ChainNode"] = ()) -> None:
+		self.start: Union[ChainNode, None] = None
+		self.end: Union[ChainNode, None] = None
+		self.length: int = 0
+		self.names: dict[Any, ChainNode] = {}
+		self.counters: dict[str, int] = {}
+		self.order = None
+
+		for node in nodes:
+			self.append(node)
+
+
+	def __repr__(self) -> "str":
+		return "<{list_class}:{length}>".format(
+			list_class = type(self).__name__,
+			length = self.length
+		)
+
+
+	def __len__(self) -> "int":
+		return self.length
+
+
+	def __iter__(self) -> "ChainNode":
+		node: Union[ChainNode, None] = self.start
+
+		while(node != None):
+			yield node
+			node = node._child
+
+
+	def __reversed__(self) -> "ChainNode":
+		node: Union[ChainNode, None] = self.end
+
+		while(node != None):
+			yield node
+			node = node._parent
+
+
+	def __contains__(self, key: Any) -> "bool":
+		return key in self.names
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def head(self) -> Union["ChainNode", None]:
+		"""
+		The first node of the list, the least recently moved to the end.
+
+		- Since: 1.1
+		"""
+
+		return self.start
+
+
+	@property
+	def tail(self) -> Union["ChainNode", None]:
+		"""
+		The last node of the list, the most recently moved to the end.
+
+		- Since: 1.1
+		"""
+
+		return self.end
+
+
+	# -------------------------------------------------
+
+
+	def _link(self, node: "ChainNode") -> None:
+		"""
+		Connect node after the tail.
+		"""
+
+		tail: Union[ChainNode, None] = self.end
+		node._parent = tail
+		node._child = None
+
+		if (tail == None):
+			self.start = node
+		else:
+			tail._child = node
+
+		self.end = node
+		self.length += 1
+
+		if (self.order != None):
+			self.order.insert(tail, [node])
+
+
+	def _unlink(self, node: "ChainNode") -> tuple[Union["ChainNode", None], Union["ChainNode", None]]:
+		"""
+		Disconnect node and connect his parent and child together, the old parent and child are returned.
+		"""
+
+		parent: Union[ChainNode, None] = node._parent
+		child: Union[ChainNode, None] = node._child
+
+		if (self.order != None):
+			self.order.remove(node, 1)
+
+		if (parent == None):
+			self.start = child
+		else:
+			parent._child = child
+
+		if (child == None):
+			self.end = parent
+		else:
+			child._parent = parent
+
+		node._parent = None
+		node._child = None
+		self.length -= 1
+		return (parent, child)
+
+
+	def _check(self, node: "ChainNode") -> None:
+
+		if ((isinstance(node, ChainNode) == False) or (node._chain != self)):
+			raise Exception("The Node is not part of the list.")
+
+
+	# -------------------------------------------------
+
+
+	def get(self, key: Any, default: Any = None) -> Union["ChainNode", Any]:
+		"""
+		Get the node wich use key as name.
+
+		Returns:
+			The found node or `default` if no node use the key.
+
+		- Since: 1.1
+		"""
+
+		return self.names.get(key, default)
+
+
+	def append(self, node: "ChainNode") -> None:
+		"""
+		Add node after the tail of the list.
+
+		If the node is connected to other nodes or his name is already used inside the list an exception will throw.
+
+		- Since: 1.1
+		"""
+
+		if (isinstance(node, ChainNode) == False):
+			raise Exception("Tried to add '{type_name}' to the list.".format(
+				type_name = type(node).__name__
+			))
+
+		if ((node._parent != None) or (node._child != None)):
+			raise Exception("Tried to add a Node connected to other nodes.")
+
+		if (node._name in self.names):
+			raise Exception("The name '{name}' is already used inside the list.".format(
+				name = node._name
+			))
+
+		tail: Union[ChainNode, None] = self.end
+		self._link(node)
+		self.names[node._name] = node
+		node._chain = self
+
+		if (tail != None):
+			node._parent_changed()
+			tail._child_changed()
+
+
+	def remove(self, node: "ChainNode") -> None:
+		"""
+		Disconnect node from the list, the node get back a chain of his own.
+
+		If the node is not part of the list an exception will throw.
+
+		- Since: 1.1
+		"""
+
+		self._check(node)
+		parent, child = self._unlink(node)
+		del self.names[node._name]
+		node._chain = type(node)._header_type(node)
+
+		if (parent != None):
+			node._parent_changed()
+			parent._child_changed()
+
+		if (child != None):
+			node._child_changed()
+			child._parent_changed()
+
+
+	def move_to_end(self, node: "ChainNode") -> None:
+		"""
+		Move node from his position to the tail of the list.
+
+		If the node is not part of the list an exception will throw.
+
+		- Since: 1.1
+		"""
+
+		self._check(node)
+
+		if (node == self.end):
+			return
+
+		tail: ChainNode = self.end
+		parent, child = self._unlink(node)
+		self._link(node)
+
+		if (parent != None):
+			parent._child_changed()
+
+		child._parent_changed()
+		tail._child_changed()
+		node._parent_changed()
+		node._child_changed()
+
+
+	def pop_front(self) -> "ChainNode":
+		"""
+		Remove the head of the list.
+
+		If the list is empty an exception will throw.
+
+		Returns:
+			The removed node.
+
+		- Since: 1.1
+		"""
+
+		if (self.start == None):
+			raise IndexError("Pop from an empty list.")
+
+		node: ChainNode = self.start
+		self.remove(node)
+		return node
+
+
+	def pop(self) -> "ChainNode":
+		"""
+		Remove the tail of the list.
+
+		If the list is empty an exception will throw.
+
+		Returns:
+			The removed node.
+
+		- Since: 1.1
+		"""
+
+		if (self.end == None):
+			raise IndexError("Pop from an empty list.")
+
+		node: ChainNode = self.end
+		self.remove(node)
+		return node
+
+
+# -------------------------------------------------
+
+
+class ChainCacheEntry(ChainNode):
+	"""
+	A node of a `ChainCache`, the name is the key of the value.
+
+	- Since: 1.1
+	"""
+
+
+	def __init__(self, key: Any, value: Any) -> None:
+		super().__init__(key)
+		self.value: Any = value
+
+
+	@property
+	def key(self) -> Any:
+		"""
+		The key of the value.
+
+		- Since: 1.1
+		"""
+
+		return self._name
+
+
+# -------------------------------------------------
+
+
+class ChainCache():
+	"""
+	A cache with a maximum amount of values, when it is full the least recently used value is evicted.
+
+	The values are kept inside a `ChainList` in recency order, so reading, adding and evicting are constant time.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, capacity: "int") -> None:
+
+		if (capacity < 1):
+			raise Exception("The capacity must be at least 1.")
+
+		self._capacity: int = capacity
+		self._entries: ChainList = ChainList()
+
+
+	def __repr__(self) -> "str":
+		return "<{cache_class}:{length}/{capacity}>".format(
+			cache_class = type(self).__name__,
+			length = len(self._entries),
+			capacity = self._capacity
+		)
+
+
+	def __len__(self) -> "int":
+		return len(self._entries)
+
+
+	def __contains__(self, key: Any) -> "bool":
+		return key in self._entries
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def capacity(self) -> "int":
+		"""
+		The maximum amount of values, reducing it evict the least recently used values.
+
+		- Since: 1.1
+		"""
+
+		return self._capacity
+
+
+	@capacity.setter
+	def capacity(self, capacity: "int") -> None:
+
+		if (capacity < 1):
+			raise Exception("The capacity must be at least 1.")
+
+		self._capacity = capacity
+
+		while(len(self._entries) > capacity):
+			self._entries.pop_front()
+
+
+	@property
+	def entries(self) -> "ChainList":
+		"""
+		The list of entries from the least to the most recently used.
+
+		- Since: 1.1
+		"""
+
+		return self._entries
+
+
+	# -------------------------------------------------
+
+
+	def get(self, key: Any, default: Any = None) -> Any:
+		"""
+		Get the value of key and mark it as the most recently used.
+
+		Returns:
+			The value or `default` if the key is not inside the cache.
+
+		- Since: 1.1
+		"""
+
+		entry: Union[ChainCacheEntry, None] = self._entries.names.get(key)
+
+		if (entry == None):
+			return default
+
+		self._entries.move_to_end(entry)
+		return entry.value
+
+
+	def put(self, key: Any, value: Any) -> Union["ChainCacheEntry", None]:
+		"""
+		Set the value of key and mark it as the most recently used.
+
+		Returns:
+			The entry evicted to make space or `None` if nothing was evicted.
+
+		- Since: 1.1
+		"""
+
+		entry: Union[ChainCacheEntry, None] = self._entries.names.get(key)
+
+		if (entry != None):
+			entry.value = value
+			self._entries.move_to_end(entry)
+			return None
+
+		self._entries.append(ChainCacheEntry(key, value))
+
+		if (len(self._entries) > self._capacity):
+			return self._entries.pop_front()
+
+		return None
+
+
+	def pop(self, key: Any, default: Any = None) -> Any:
+		"""
+		Remove key from the cache.
+
+		Returns:
+			The removed value or `default` if the key is not inside the cache.
+
+		- Since: 1.1
+		"""
+
+		entry: Union[ChainCacheEntry, None] = self._entries.names.get(key)
+
+		if (entry == None):
+			return default
+
+		self._entries.remove(entry)
+		return entry.value
+
+
+# -------------------------------------------------
+
@@ -0,0 +1,765 @@
+"""
+Child List,
+containers for the childrens of a `TreeNode`.
+
+`ChildList` store the nodes inside blocks, so inserting or removing a node
+only shift the nodes of a single block instead of the whole list.
+
+`LazyChildList` ask the nodes to a loader the first time they are used,
+and a `LoaderPool` can unload the least recently used ones.
+
+- since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+from typing import Any, Callable, Iterable, Union
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from itertools import chain
+from weakref import ref as weak_ref
+from weakref import WeakSet
+
+
+# -------------------------------------------------
+
+
+CHILD_BLOCK_SIZE: "int" = 512
+"""
+The amount of nodes a block of a `ChildList` can hold before being split in two.
+
+- Since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+class ChildList():
+	"""
+	A list-like container of nodes stored inside blocks, used by `TreeNode` when his childrens become too many for a plain list.
+
+	The size of each block is kept inside a Fenwick tree, so a position is converted into a block in logarithmic time,
+	and each node is mapped to his block, so `index` only search inside a single block.
+
+	The nodes are also indexed by name, so `claim_name` find an unused name without comparing all the nodes.
+
+	It support the list operations used by the nodes: iteration, `len`, indexing, slicing, `insert`, `append`, `index`, `remove`, `sort` and `del`.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, items: Iterable[Any] = (), block_size: "int" = CHILD_BLOCK_SIZE) -> None:
+		self._block_size: int = block_size
+		self._counters: dict[str, int] = {}
+		self._rebuild(list(items))
+
+
+	def __repr__(self) -> "str":
+		return "{list_class}({items})".format(
+			list_class = type(self).__name__,
+			items = list(self)
+		)
+
+
+	def __len__(self) -> "int":
+		return self._length
+
+
+	def __iter__(self) -> Any:
+		return chain.from_iterable(self._blocks)
+
+
+	def __reversed__(self) -> Any:
+		return chain.from_iterable(map(reversed, reversed(self._blocks)))
+
+
+	def __contains__(self, item: Any) -> "bool":
+		block: Union[list, None] = self._owners.get(id(item))
+		return (block != None) and (item in block)
+
+
+	def __getitem__(self, index: Union["int", "slice"]) -> Any:
+
+		if (isinstance(index, slice) == True):
+			return list(self)[index]
+
+		block, offset = self._locate(self._normalize(index))
+		return self._blocks[block][offset]
+
+
+	def __setitem__(self, index: Union["int", "slice"], item: Any) -> None:
+
+		if (isinstance(index, slice) == True):
+
+			if (index != slice(None)):
+				raise Exception("Only the whole slice can be assigned to a '{list_class}'.".format(
+					list_class = type(self).__name__
+				))
+
+			self._rebuild(list(item))
+			return
+
+		block, offset = self._locate(self._normalize(index))
+		old: Any = self._blocks[block][offset]
+		del self._owners[id(old)]
+		self._forget_name(old)
+		self._blocks[block][offset] = item
+		self._owners[id(item)] = self._blocks[block]
+		self._names.setdefault(item._name, item)
+
+
+	def __delitem__(self, index: "int") -> None:
+		block, offset = self._locate(self._normalize(index))
+		item: Any = self._blocks[block].pop(offset)
+		del self._owners[id(item)]
+		self._forget_name(item)
+		self._length -= 1
+
+		if ((len(self._blocks[block]) == 0) and (len(self._blocks) > 1)):
+			del self._blocks[block]
+			self._index_blocks()
+		else:
+			self._add(block, -1)
+
+
+	# -------------------------------------------------
+
+
+	def _rebuild(self, items: list) -> None:
+		"""
+		Split all the items into new blocks.
+		"""
+
+		size: int = self._block_size
+		self._blocks: list[list] = [items[n:n + size] for n in range(0, len(items), size)] or [[]]
+		self._owners: dict[int, list] = {}
+		self._names: dict[str, Any] = {}
+		self._length: int = len(items)
+
+		for block in self._blocks:
+
+			for item in block:
+				self._owners[id(item)] = block
+				self._names.setdefault(item._name, item)
+
+		self._index_blocks()
+
+
+	def _forget_name(self, item: Any) -> None:
+		"""
+		Remove the name of item from the name index, if item is the one using it.
+		"""
+
+		if (self._names.get(item._name) == item):
+			del self._names[item._name]
+
+
+	def _index_blocks(self) -> None:
+		"""
+		Rebuild the position of each block and the Fenwick tree of their sizes.
+		"""
+
+		count: int = len(self._blocks)
+		sizes: list[int] = [0] * (count + 1)
+
+		for n in range(1, count + 1):
+			sizes[n] += len(self._blocks[n - 1])
+			parent: int = n + (n & -n)
+
+			if (parent <= count):
+				sizes[parent] += sizes[n]
+
+		self._sizes: list[int] = sizes
+		self._positions: dict[int, int] = {id(block): n for n, block in enumerate(self._blocks)}
+		self._step: int = 1 << (count.bit_length() - 1)
+
+
+	def _add(self, block: "int", amount: "int") -> None:
+		"""
+		Change the size of a block inside the Fenwick tree.
+		"""
+
+		block += 1
+
+		while(block < len(self._sizes)):
+			self._sizes[block] += amount
+			block += block & -block
+
+
+	def _prefix(self, block: "int") -> "int":
+		"""
+		The amount of items inside the blocks before the input block.
+		"""
+
+		total: int = 0
+
+		while(block > 0):
+			total += self._sizes[block]
+			block -= block & -block
+
+		return total
+
+
+	def _locate(self, index: "int") -> tuple["int", "int"]:
+		"""
+		Convert a valid index position into a block and the position inside it.
+		"""
+
+		block: int = 0
+		step: int = self._step
+		count: int = len(self._sizes) - 1
+
+		while(step > 0):
+
+			if ((block + step <= count) and (self._sizes[block + step] <= index)):
+				block += step
+				index -= self._sizes[block]
+
+			step >>= 1
+
+		return (block, index)
+
+
+	def _normalize(self, index: "int") -> "int":
+
+		if (index < 0):
+			index += self._length
+
+		if ((index < 0) or (index >= self._length)):
+			raise IndexError("ChildList index out of range.")
+
+		return index
+
+
+	# -------------------------------------------------
+
+
+	def insert(self, index: "int", item: Any) -> None:
+		"""
+		Insert an item before the index position, like `list.insert`.
+
+		- Since: 1.1
+		"""
+
+		if (index < 0):
+			index = max(0, index + self._length)
+
+		if (index >= self._length):
+			block: int = len(self._blocks) - 1
+			offset: int = len(self._blocks[block])
+		else:
+			block, offset = self._locate(index)
+
+		items: list = self._blocks[block]
+		items.insert(offset, item)
+		self._owners[id(item)] = items
+		self._names.setdefault(item._name, item)
+		self._length += 1
+
+		if (len(items) > self._block_size * 2):
+			half: list = items[self._block_size:]
+			del items[self._block_size:]
+
+			for moved in half:
+				self._owners[id(moved)] = half
+
+			self._blocks.insert(block + 1, half)
+			self._index_blocks()
+		else:
+			self._add(block, 1)
+
+
+	def append(self, item: Any) -> None:
+		"""
+		Add an item at the end, like `list.append`.
+
+		- Since: 1.1
+		"""
+
+		self.insert(self._length, item)
+
+
+	def index(self, item: Any) -> "int":
+		"""
+		Get the index position of an item, like `list.index`, only the block of the item is searched.
+
+		- Since: 1.1
+		"""
+
+		block: Union[list, None] = self._owners.get(id(item))
+
+		if (block == None):
+			raise ValueError("The item is not inside the ChildList.")
+
+		return self._prefix(self._positions[id(block)]) + block.index(item)
+
+
+	def remove(self, item: Any) -> None:
+		"""
+		Remove an item, like `list.remove`.
+
+		- Since: 1.1
+		"""
+
+		del self[self.index(item)]
+
+
+	def claim_name(self, item: Any, name: "str") -> "str":
+		"""
+		Find a name not used by the other items and record it as the name of item, a counter is added to name if it is already used.
+
+		The last counter of each name is remembered, so a counter freed by a removed item is not used again.
+
+		Returns:
+			The unique name, it must be given to item.
+
+		- Since: 1.1
+		"""
+
+		self._forget_name(item)
+
+		if (self._names.get(name, item) != item):
+			count: int = self._counters.get(name, 0)
+
+			while(True):
+				count += 1
+				fix_name: str = f"{name}{count}"
+
+				if ((fix_name in self._names) == False):
+					break
+
+			self._counters[name] = count
+			name = fix_name
+
+		self._names[name] = item
+		return name
+
+
+	def sort(self, key = None, reverse: "bool" = False) -> None:
+		"""
+		Sort the items, like `list.sort`.
+
+		- Since: 1.1
+		"""
+
+		items: list = list(self)
+		items.sort(key = key, reverse = reverse)
+		self._rebuild(items)
+
+
+# -------------------------------------------------
+
+
+def _owner_freed(childrens_ref: "weak_ref", owner_ref: "weak_ref") -> None:
+	"""
+	Release the loaded nodes of a `LazyChildList` whose owner has been freed.
+	"""
+
+	childrens: Union[LazyChildList, None] = childrens_ref()
+
+	if (childrens != None):
+		childrens._release()
+
+
+# -------------------------------------------------
+
+
+class LazyChildList():
+	"""
+	A list-like container whose nodes are given by a loader the first time any of them is used, see `TreeNode.set_loader`.
+
+	Once loaded it behave like a plain list, every use also mark it as recently used inside his `LoaderPool`.
+
+	The owner is kept as a weak reference, so a Node with weak parents is still freed when it is no longer used,
+	his loaded nodes are then released from the pool.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, owner: Any, loader: Callable, pool: "LoaderPool" = None) -> None:
+		self._owner_ref: weak_ref = weak_ref(owner, partial(_owner_freed, weak_ref(self)))
+		self._loader: Callable = loader
+		self._pool: Union[LoaderPool, None] = pool
+		self._items: Union[list, None] = None
+
+
+	def __repr__(self) -> "str":
+		return "{list_class}({items})".format(
+			list_class = type(self).__name__,
+			items = "..." if (self._items == None) else self._items
+		)
+
+
+	def __len__(self) -> "int":
+		return len(self._get())
+
+
+	def __iter__(self) -> Any:
+		return iter(self._get())
+
+
+	def __reversed__(self) -> Any:
+		return reversed(self._get())
+
+
+	def __contains__(self, item: Any) -> "bool":
+		return item in self._get()
+
+
+	def __getitem__(self, index: Union["int", "slice"]) -> Any:
+		return self._get()[index]
+
+
+	def __setitem__(self, index: Union["int", "slice"], item: Any) -> None:
+		items: list = self._get()
+		size: int = len(items)
+		items[index] = item
+		self._resize(len(items) - size)
+
+
+	def __delitem__(self, index: "int") -> None:
+		del self._get()[index]
+		self._resize(-1)
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def loaded(self) -> "bool":
+		"""
+		If the loader has already given the nodes.
+
+		- Since: 1.1
+		"""
+
+		return self._items != None
+
+
+	# -------------------------------------------------
+
+
+	def _get(self) -> "list":
+		"""
+		Give the loaded items, the loader is executed the first time.
+		"""
+
+		if (self._items == None):
+			owner: Any = self._owner_ref()
+
+			if (owner == None):
+				raise Exception("The Node of the childrens has been freed.")
+
+			self._items = []
+
+			# The owner validate the nodes and add them with `append`.
+			owner._load_childrens(self._loader(owner))
+
+			if (self._pool != None):
+				self._pool._add(self)
+
+		elif (self._pool != None):
+			self._pool._touch(self)
+
+		return self._items
+
+
+	def _resize(self, amount: "int") -> None:
+
+		if ((self._pool != None) and (self in self._pool._entries)):
+			self._pool._entries[self] += amount
+			self._pool._size += amount
+
+
+	# -------------------------------------------------
+
+
+	def insert(self, index: "int", item: Any) -> None:
+		"""
+		Insert an item before the index position, like `list.insert`.
+
+		- Since: 1.1
+		"""
+
+		self._get().insert(index, item)
+		self._resize(1)
+
+
+	def append(self, item: Any) -> None:
+		"""
+		Add an item at the end, like `list.append`.
+
+		- Since: 1.1
+		"""
+
+		self._get().append(item)
+		self._resize(1)
+
+
+	def index(self, item: Any) -> "int":
+		"""
+		Get the index position of an item, like `list.index`.
+
+		- Since: 1.1
+		"""
+
+		return self._get().index(item)
+
+
+	def remove(self, item: Any) -> None:
+		"""
+		Remove an item, like `list.remove`.
+
+		- Since: 1.1
+		"""
+
+		self._get().remove(item)
+		self._resize(-1)
+
+
+	def sort(self, key = None, reverse: "bool" = False) -> None:
+		"""
+		Sort the items, like `list.sort`.
+
+		- Since: 1.1
+		"""
+
+		self._get().sort(key = key, reverse = reverse)
+
+
+	def unload(self) -> None:
+		"""
+		Forget the loaded nodes, they will be asked again to the loader the next time they are used.
+
+		The nodes are unparented from the owner and any loaded sub-childrens is also removed from the pool.
+
+		- Since: 1.1
+		"""
+
+		items: Union[list, None] = self._release()
+		owner: Any = self._owner_ref()
+
+		if ((items != None) and (owner != None)):
+			owner._unload_childrens(items)
+
+
+	def _release(self) -> Union["list", None]:
+		"""
+		Forget the loaded nodes without unparenting them, the forgotten nodes are given back.
+		"""
+
+		items: Union[list, None] = self._items
+
+		if (items == None):
+			return None
+
+		self._items = None
+
+		if (self._pool != None):
+			self._pool._discard(self)
+
+		stack: list = list(items)
+
+		# Loaded lists inside the forgotten nodes are no longer reachable.
+		while(len(stack) > 0):
+			childrens: Any = stack.pop()._childrens
+
+			if (isinstance(childrens, LazyChildList) == True):
+
+				if (childrens._pool != None):
+					childrens._pool._discard(childrens)
+
+				childrens = childrens._items or ()
+
+			stack.extend(childrens)
+
+		return items
+
+
+# -------------------------------------------------
+
+
+class LoaderPool():
+	"""
+	Keep track of the nodes loaded by `LazyChildList` containers, when they are more than the budget the least recently used containers are unloaded.
+
+	The budget is a soft limit, the containers above the last loaded one are never unloaded,
+	and while any `hold` is active no container is unloaded automatically, all the pools are trimmed when the last `hold` end.
+
+	- Since: 1.1
+	"""
+
+
+	_holds: int = 0
+	"""
+	The amount of active `hold` calls, shared by all the pools.
+	"""
+
+	_pools: WeakSet = WeakSet()
+	"""
+	All the pools still in use, trimmed when the last `hold` end.
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, budget: "int") -> None:
+
+		if (budget < 0):
+			raise Exception("The budget can't be negative.")
+
+		self._budget: int = budget
+		self._size: int = 0
+		self._entries: OrderedDict[LazyChildList, int] = OrderedDict()
+		LoaderPool._pools.add(self)
+
+
+	def __repr__(self) -> "str":
+		return "<{pool_class}:{size}/{budget}>".format(
+			pool_class = type(self).__name__,
+			size = self._size,
+			budget = self._budget
+		)
+
+
+	def __len__(self) -> "int":
+		return len(self._entries)
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def budget(self) -> "int":
+		"""
+		The amount of loaded nodes the pool try to keep.
+
+		- Since: 1.1
+		"""
+
+		return self._budget
+
+
+	@budget.setter
+	def budget(self, budget: "int") -> None:
+
+		if (budget < 0):
+			raise Exception("The budget can't be negative.")
+
+		self._budget = budget
+		self.trim()
+
+
+	@property
+	def size(self) -> "int":
+		"""
+		The amount of nodes currently loaded by the containers of the pool.
+
+		- Since: 1.1
+		"""
+
+		return self._size
+
+
+	# -------------------------------------------------
+
+
+	def _add(self, childrens: "LazyChildList") -> None:
+		self._entries[childrens] = len(childrens._items)
+		self._size += len(childrens._items)
+
+		if (LoaderPool._holds == 0):
+			self.trim(childrens._owner_ref())
+
+
+	def _touch(self, childrens: "LazyChildList") -> None:
+
+		if (childrens in self._entries):
+			self._entries.move_to_end(childrens)
+
+
+	def _discard(self, childrens: "LazyChildList") -> None:
+		self._size -= self._entries.pop(childrens, 0)
+
+
+	# -------------------------------------------------
+
+
+	def trim(self, keep: Any = None) -> None:
+		"""
+		Unload the least recently used containers until the loaded nodes fit inside the budget.
+
+		Params:
+			`keep` (TreeNode): Optional Node whose childrens and parents childrens are never unloaded.
+
+		- Since: 1.1
+		"""
+
+		if (self._size <= self._budget):
+			return
+
+		kept: set[int] = set()
+
+		while(keep != None):
+			kept.add(id(keep._childrens))
+			keep = keep._parent
+
+		for childrens in list(self._entries):
+
+			if (self._size <= self._budget):
+				break
+
+			if (((childrens in self._entries) == True) and ((id(childrens) in kept) == False)):
+				childrens.unload()
+
+
+	@classmethod
+	@contextmanager
+	def hold(cls) -> Any:
+		"""
+		Stop all the pools from unloading containers automatically inside a `with` statement,
+		use it around walks that may load more Nodes than the budget while they still need the Nodes already visited.
+
+		When the last `hold` end every pool is trimmed back to his budget.
+
+		- Since: 1.1
+		"""
+
+		cls._holds += 1
+
+		try:
+			yield
+		finally:
+			cls._holds -= 1
+
+			if (cls._holds == 0):
+
+				for pool in list(LoaderPool._pools):
+					pool.trim()
+
+
+	def clear(self) -> None:
+		"""
+		Unload all the containers of the pool.
+
+		- Since: 1.1
+		"""
+
+		for childrens in list(self._entries):
+			childrens.unload()
+
+
+# -------------------------------------------------
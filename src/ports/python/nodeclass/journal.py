@@ -0,0 +1,770 @@
+"""
+Tree Journal,
+save the changes of a tree as an append-only log.
+
+Each change is written as a small binary record, so saving an edit
+cost the size of the edit instead of the size of the whole tree.
+The log can be replayed to rebuild the tree and compacted into a snapshot.
+
+- since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+import os
+from typing import Any, Union
+from struct import Struct
+from weakref import WeakValueDictionary
+
+from nodeclass.tree import TreeNode
+
+
+# -------------------------------------------------
+
+
+TREE_JOURNAL_MAGIC: "bytes" = b"NCTJ0001"
+"""
+The bytes at the begin of a log written by `TreeJournal`.
+
+- Since: 1.1
+"""
+
+
+_RECORD_ROOT: int = 1
+_RECORD_ADD: int = 2
+_RECORD_ATTACH: int = 3
+_RECORD_REMOVE: int = 4
+_RECORD_MOVE: int = 5
+_RECORD_RENAME: int = 6
+_RECORD_FREE: int = 7
+_RECORD_REORDER: int = 8
+
+# The fields of each record: i for numbers, s for strings and l for lists of numbers.
+_LAYOUTS: dict[int, str] = {
+	_RECORD_ROOT: "is",
+	_RECORD_ADD: "iiis",
+	_RECORD_ATTACH: "iii",
+	_RECORD_REMOVE: "i",
+	_RECORD_MOVE: "ii",
+	_RECORD_RENAME: "is",
+	_RECORD_FREE: "i",
+	_RECORD_REORDER: "il",
+}
+
+_OPCODE: Struct = Struct("<B")
+_INT: Struct = Struct("<q")
+_SIZE: Struct = Struct("<I")
+
+
+# -------------------------------------------------
+
+
+def _encode(opcode: "int", *fields: Union["int", "str", "list"]) -> "bytes":
+	"""
+	Encode a record, numbers are stored as 8 bytes, strings and lists of numbers are prefixed by their length.
+	"""
+
+	data: bytearray = bytearray(_OPCODE.pack(opcode))
+
+	for field in fields:
+
+		if (isinstance(field, str) == True):
+			text: bytes = field.encode("utf-8")
+			data += _SIZE.pack(len(text))
+			data += text
+		elif (isinstance(field, list) == True):
+			data += _SIZE.pack(len(field))
+			data += Struct("<%dq" % len(field)).pack(*field)
+		else:
+			data += _INT.pack(field)
+
+	return bytes(data)
+
+
+def _write_snapshot(file: Any, roots: list["TreeNode"], get_id) -> None:
+	"""
+	Write each root and his childrens as records, the Nodes keep the id given by `get_id`.
+	"""
+
+	for root in roots:
+		file.write(_encode(_RECORD_ROOT, get_id(root), root._name))
+		stack: list[TreeNode] = [root]
+
+		while(len(stack) > 0):
+			node: TreeNode = stack.pop()
+
+			for child in node._childrens:
+				file.write(_encode(_RECORD_ADD, get_id(node), get_id(child), -1, child._name))
+
+			stack.extend(reversed(node._childrens))
+
+
+# -------------------------------------------------
+
+
+def replay(log: "str", node_type: type = TreeNode) -> "TreeNode":
+	"""
+	Rebuild the tree saved inside a log.
+
+	Params:
+		`log` (str): The path of the log.
+		`node_type` (type): The class of the rebuilt Nodes.
+
+	Returns:
+		The root of the tree.
+
+	- Since: 1.1
+	"""
+
+	with JournalReader(log, node_type) as reader:
+		reader.read()
+		return reader.root
+
+
+def compact(log: "str") -> None:
+	"""
+	Replace a log with a snapshot of the tree it describe, all the changes are folded into a single record for each Node.
+
+	The Node ids are kept, so a `TreeJournal` opened with `TreeJournal.load` can continue the compacted log.
+	The log must not be written by a `TreeJournal` meanwhile, use `TreeJournal.compact` for a log in use.
+
+	- Since: 1.1
+	"""
+
+	with JournalReader(log) as reader:
+		reader.read()
+		ids: dict[int, int] = reader._ids
+		roots: list[TreeNode] = [reader.root] + [node for node in reader.nodes.values() if ((node._parent == None) and (node != reader.root))]
+
+	temporary: str = log + ".compact"
+
+	with open(temporary, "wb") as file:
+		file.write(TREE_JOURNAL_MAGIC)
+		_write_snapshot(file, roots, lambda node: ids[id(node)])
+
+	os.replace(temporary, log)
+
+
+# -------------------------------------------------
+
+
+class JournalReader():
+	"""
+	Apply the records of a log to a tree, `read` can be called again to catch up with the records appended later.
+
+	An incomplete record at the end of the log, like one being written, is left for the next `read`.
+	A compacted log is a new file, the reader can't catch up with it and a new reader must be created.
+
+	Call `close` when the reader is not used anymore, it can also be used with the `with` statement.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, log: "str", node_type: type = TreeNode) -> None:
+		self._log: str = log
+		self._file: Any = open(log, "rb")
+		self._node_type: type = node_type
+		self._offset: int = 0
+		self._root: Union[TreeNode, None] = None
+		self._nodes: dict[int, TreeNode] = {}
+		self._ids: dict[int, int] = {}
+
+		if (self._file.read(len(TREE_JOURNAL_MAGIC)) != TREE_JOURNAL_MAGIC):
+			self._file.close()
+			raise Exception("The file '{log}' is not a tree journal.".format(
+				log = log
+			))
+
+		self._offset = len(TREE_JOURNAL_MAGIC)
+
+
+	def __enter__(self) -> "JournalReader":
+		return self
+
+
+	def __exit__(self, *exception) -> None:
+		self.close()
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def root(self) -> Union["TreeNode", None]:
+		"""
+		The root of the tree, the first Node saved inside the log.
+
+		- Since: 1.1
+		"""
+
+		return self._root
+
+
+	@property
+	def nodes(self) -> dict[int, "TreeNode"]:
+		"""
+		The Nodes of the tree and the ones removed but not freed, by their id inside the log.
+
+		- Since: 1.1
+		"""
+
+		return self._nodes
+
+
+	@property
+	def offset(self) -> "int":
+		"""
+		The position inside the log after the last applied record.
+
+		- Since: 1.1
+		"""
+
+		return self._offset
+
+
+	# -------------------------------------------------
+
+
+	def read(self) -> "int":
+		"""
+		Apply all the complete records written after the last `read`.
+
+		Returns:
+			The amount of applied records.
+
+		- Since: 1.1
+		"""
+
+		if (os.stat(self._log).st_ino != os.fstat(self._file.fileno()).st_ino):
+			raise Exception("The log '{log}' has been compacted, create a new reader to read it.".format(
+				log = self._log
+			))
+
+		self._file.seek(self._offset)
+		data: bytes = self._file.read()
+		position: int = 0
+		count: int = 0
+
+		while(True):
+			record: Union[tuple, None] = self._decode(data, position)
+
+			if (record == None):
+				break
+
+			position, opcode, fields = record
+			self._apply(opcode, fields)
+			count += 1
+
+		self._offset += position
+		return count
+
+
+	def close(self) -> None:
+		"""
+		Close the log.
+
+		- Since: 1.1
+		"""
+
+		self._file.close()
+
+
+	# -------------------------------------------------
+
+
+	def _decode(self, data: "bytes", position: "int") -> Union[tuple, None]:
+		"""
+		Decode the record at position, `None` is returned if the record is not complete.
+		"""
+
+		if (position >= len(data)):
+			return None
+
+		opcode: int = data[position]
+		position += 1
+		fields: list = []
+
+		if ((opcode in _LAYOUTS) == False):
+			raise Exception("Unknown record '{opcode}' inside the journal.".format(
+				opcode = opcode
+			))
+
+		for layout in _LAYOUTS[opcode]:
+
+			if (layout == "i"):
+
+				if (position + _INT.size > len(data)):
+					return None
+
+				fields.append(_INT.unpack_from(data, position)[0])
+				position += _INT.size
+				continue
+
+			if (position + _SIZE.size > len(data)):
+				return None
+
+			size: int = _SIZE.unpack_from(data, position)[0]
+			position += _SIZE.size
+
+			if (layout == "s"):
+
+				if (position + size > len(data)):
+					return None
+
+				fields.append(str(data[position:position + size], "utf-8"))
+				position += size
+			else:
+
+				if (position + size * _INT.size > len(data)):
+					return None
+
+				fields.append(list(Struct("<%dq" % size).unpack_from(data, position)))
+				position += size * _INT.size
+
+		return (position, opcode, fields)
+
+
+	def _apply(self, opcode: "int", fields: "list") -> None:
+		nodes: dict[int, TreeNode] = self._nodes
+
+		if (opcode == _RECORD_ROOT):
+			node: TreeNode = self._node_type(fields[1])
+			nodes[fields[0]] = node
+			self._ids[id(node)] = fields[0]
+
+			if (self._root == None):
+				self._root = node
+
+		elif (opcode == _RECORD_ADD):
+			node = self._node_type(fields[3])
+			nodes[fields[1]] = node
+			self._ids[id(node)] = fields[1]
+			nodes[fields[0]].add_child(node, fields[2])
+
+		elif (opcode == _RECORD_ATTACH):
+			nodes[fields[0]].add_child(nodes[fields[1]], fields[2])
+
+		elif (opcode == _RECORD_REMOVE):
+			nodes[fields[0]].remove()
+
+		elif (opcode == _RECORD_MOVE):
+			nodes[fields[0]].move(fields[1])
+
+		elif (opcode == _RECORD_RENAME):
+			nodes[fields[0]].rename(fields[1])
+
+		elif (opcode == _RECORD_FREE):
+			node = nodes[fields[0]]
+			subtree: list[TreeNode] = [node]
+
+			for current in subtree:
+				subtree.extend(current._childrens)
+
+			node.free()
+
+			# The ids are found from the freed Nodes, so the other Nodes are not searched.
+			for current in subtree:
+				del nodes[self._ids.pop(id(current))]
+
+		elif (opcode == _RECORD_REORDER):
+			nodes[fields[0]].reorder_children(fields[1])
+
+
+# -------------------------------------------------
+
+
+class TreeJournal():
+	"""
+	Write every change of a tree of `JournaledTreeNode` to a log, each Node receive an id used by the records.
+
+	The recorded changes are `add_child`, `remove_child`, `move_child`, `rename`, `free`, `sort_children` and `reorder_children`,
+	only the names and the connections are saved, the other attributes of the Nodes are not.
+	Childrens added by a `TreeBuilder` or a loader are not recorded.
+
+	Call `close` when the journal is not used anymore, it can also be used with the `with` statement.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, log: "str", root: "JournaledTreeNode", fsync: "bool" = False) -> None:
+		"""
+		Start a new log with a snapshot of root, if the log already exist an exception will throw.
+
+		Params:
+			`log` (str): The path of the new log.
+			`root` (JournaledTreeNode): The root of the tree to record.
+			`fsync` (bool): Will force each record to the disk before the change return.
+		"""
+
+		self._log: str = log
+		self._fsync: bool = fsync
+		self._root: JournaledTreeNode = root
+		self._nodes: WeakValueDictionary[int, JournaledTreeNode] = WeakValueDictionary()
+		self._next_id: int = 0
+		self._quiet: int = 0
+
+		self._check(root)
+		self._file: Any = open(log, "xb")
+		self._file.write(TREE_JOURNAL_MAGIC)
+		self._track(root)
+		_write_snapshot(self._file, [root], lambda node: node._journal_id)
+		self._flush()
+
+
+	def __enter__(self) -> "TreeJournal":
+		return self
+
+
+	def __exit__(self, *exception) -> None:
+		self.close()
+
+
+	# -------------------------------------------------
+
+
+	@classmethod
+	def load(cls, log: "str", node_type: type = None, fsync: "bool" = False) -> "TreeJournal":
+		"""
+		Rebuild the tree of an existing log and continue to record his changes inside it.
+
+		An incomplete record at the end of the log is removed.
+
+		Params:
+			`log` (str): The path of the log.
+			`node_type` (type): The class of the rebuilt Nodes, by default `JournaledTreeNode`.
+			`fsync` (bool): Will force each record to the disk before the change return.
+
+		Returns:
+			The journal, his `root` is the rebuilt tree.
+
+		- Since: 1.1
+		"""
+
+		node_type = node_type or JournaledTreeNode
+
+		# The rebuilt Nodes are new and all of the same class, so the class is checked once instead of each Node.
+		if ((isinstance(node_type, type) == False) or (issubclass(node_type, JournaledTreeNode) == False)):
+			raise Exception("Only '{node}' objects can be recorded, not '{type}'.".format(
+				node = JournaledTreeNode.__name__,
+				type = getattr(node_type, "__name__", type(node_type).__name__)
+			))
+
+		with JournalReader(log, node_type) as reader:
+			reader.read()
+
+		journal: TreeJournal = cls.__new__(cls)
+		journal._log = log
+		journal._fsync = fsync
+		journal._root = reader.root
+		journal._nodes = WeakValueDictionary()
+		journal._next_id = max(reader.nodes, default = -1) + 1
+		journal._quiet = 0
+
+		for node_id, node in reader.nodes.items():
+			node._journal = journal
+			node._journal_id = node_id
+			journal._nodes[node_id] = node
+
+		journal._file = open(log, "r+b")
+		journal._file.truncate(reader.offset)
+		journal._file.seek(reader.offset)
+		return journal
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def root(self) -> "JournaledTreeNode":
+		"""
+		The root of the recorded tree.
+
+		- Since: 1.1
+		"""
+
+		return self._root
+
+
+	@property
+	def log(self) -> "str":
+		"""
+		The path of the log.
+
+		- Since: 1.1
+		"""
+
+		return self._log
+
+
+	# -------------------------------------------------
+
+
+	def _check(self, node: "TreeNode") -> None:
+		"""
+		Make sure node and his childrens can be recorded.
+		"""
+
+		stack: list[TreeNode] = [node]
+
+		while(len(stack) > 0):
+			current: TreeNode = stack.pop()
+
+			if (isinstance(current, JournaledTreeNode) == False):
+				raise Exception("Only '{node}' objects can be recorded, not '{type}'.".format(
+					node = JournaledTreeNode.__name__,
+					type = type(current).__name__
+				))
+
+			if ((current._journal != None) and (current._journal != self)):
+				raise Exception("The Node is already recorded by another journal.")
+
+			stack.extend(current._childrens)
+
+
+	def _track(self, node: "JournaledTreeNode") -> None:
+		"""
+		Give an id to node and his childrens.
+		"""
+
+		stack: list[JournaledTreeNode] = [node]
+
+		while(len(stack) > 0):
+			current: JournaledTreeNode = stack.pop()
+			current._journal = self
+			current._journal_id = self._next_id
+			self._nodes[self._next_id] = current
+			self._next_id += 1
+			stack.extend(reversed(current._childrens))
+
+
+	def _write(self, opcode: "int", *fields: Union["int", "str", "list"]) -> None:
+		self._file.write(_encode(opcode, *fields))
+		self._flush()
+
+
+	def _flush(self) -> None:
+		self._file.flush()
+
+		if (self._fsync == True):
+			os.fsync(self._file.fileno())
+
+
+	def _added(self, parent: "JournaledTreeNode", node: "JournaledTreeNode", index: "int") -> None:
+		"""
+		Record node added to parent, a Node never recorded is saved with all his childrens.
+		"""
+
+		if (node._journal == self):
+			self._write(_RECORD_ATTACH, parent._journal_id, node._journal_id, index)
+			return
+
+		self._track(node)
+		self._file.write(_encode(_RECORD_ADD, parent._journal_id, node._journal_id, index, node._name))
+		stack: list[JournaledTreeNode] = [node]
+
+		while(len(stack) > 0):
+			current: JournaledTreeNode = stack.pop()
+
+			for child in current._childrens:
+				self._file.write(_encode(_RECORD_ADD, current._journal_id, child._journal_id, -1, child._name))
+
+			stack.extend(reversed(current._childrens))
+
+		self._flush()
+
+
+	def _freed(self, node: "JournaledTreeNode", subtree: list["JournaledTreeNode"]) -> None:
+		"""
+		Record node freed with all his childrens, they are no longer tracked.
+		"""
+
+		self._write(_RECORD_FREE, node._journal_id)
+
+		for current in subtree:
+
+			if (current._journal == self):
+				self._nodes.pop(current._journal_id, None)
+				current._journal = None
+
+
+	# -------------------------------------------------
+
+
+	def compact(self) -> None:
+		"""
+		Replace the log with a snapshot of the current tree, the records written until now are folded into a single record for each Node.
+
+		The Nodes removed but still alive are kept, so they can be added again later,
+		also the ones added to a Node not recorded by the journal, their changes are still recorded.
+
+		- Since: 1.1
+		"""
+
+		roots: list[JournaledTreeNode] = [self._root]
+
+		for node in list(self._nodes.values()):
+
+			if ((node != self._root) and ((node._parent == None) or (getattr(node._parent, "_journal", None) != self))):
+				roots.append(node)
+
+		temporary: str = self._log + ".compact"
+
+		with open(temporary, "wb") as file:
+			file.write(TREE_JOURNAL_MAGIC)
+			_write_snapshot(file, roots, lambda node: node._journal_id)
+			file.flush()
+			os.fsync(file.fileno())
+
+		self._file.close()
+		os.replace(temporary, self._log)
+		self._file = open(self._log, "ab")
+
+
+	def close(self) -> None:
+		"""
+		Close the log, the changes made after are not recorded.
+
+		- Since: 1.1
+		"""
+
+		if (self._file.closed == False):
+			self._file.close()
+
+		for node in list(self._nodes.values()):
+			node._journal = None
+
+		self._nodes.clear()
+
+
+# -------------------------------------------------
+
+
+class JournaledTreeNode(TreeNode):
+	"""
+	A `TreeNode` whose changes are written to the `TreeJournal` recording his tree, a Node without journal behave like a normal `TreeNode`.
+
+	A Node added to a recorded tree is recorded from then on, all his childrens must also be `JournaledTreeNode` objects.
+
+	- Since: 1.1
+	"""
+
+
+	_structure_keys: frozenset[str] = TreeNode._structure_keys | frozenset(("_journal", "_journal_id"))
+	"""
+	The attributes that describe the connections of a Node, they are not copied as extra state when the tree is pickled.
+	"""
+
+	_journal: Union[TreeJournal, None] = None
+	"""
+	The journal recording the current Node.
+	"""
+
+	_journal_id: int = -1
+	"""
+	The id of the current Node inside the journal.
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def _recording(self) -> Union[TreeJournal, None]:
+		"""
+		Give the journal that must record a change of the current Node, `None` if the change is not recorded.
+		"""
+
+		journal: Union[TreeJournal, None] = self._journal
+		return None if ((journal == None) or (journal._quiet > 0) or (journal._file.closed == True)) else journal
+
+
+	# -------------------------------------------------
+
+
+	def add_child(self, node: "TreeNode", index: "int" = -1) -> None:
+		journal: Union[TreeJournal, None] = self._recording()
+
+		if ((journal != None) and (getattr(node, "_journal", None) != journal)):
+			journal._check(node)
+
+		super().add_child(node, index)
+
+		if (journal != None):
+			journal._added(self, node, index)
+
+
+	def remove_child(self, child: "TreeNode") -> None:
+		super().remove_child(child)
+		journal: Union[TreeJournal, None] = self._recording()
+
+		if ((journal != None) and (child._journal == journal)):
+			journal._write(_RECORD_REMOVE, child._journal_id)
+
+
+	def move_child(self, child: "TreeNode", index: "int") -> None:
+		super().move_child(child, index)
+		journal: Union[TreeJournal, None] = self._recording()
+
+		if ((journal != None) and (child._journal == journal)):
+			journal._write(_RECORD_MOVE, child._journal_id, index)
+
+
+	def rename(self, name: "str") -> None:
+		super().rename(name)
+		journal: Union[TreeJournal, None] = self._recording()
+
+		if (journal != None):
+			journal._write(_RECORD_RENAME, self._journal_id, self._name)
+
+
+	def free(self) -> None:
+		journal: Union[TreeJournal, None] = self._recording()
+
+		if (journal == None):
+			super().free()
+			return
+
+		subtree: list[TreeNode] = [self]
+
+		for current in subtree:
+			subtree.extend(current._childrens)
+
+		# The childrens freed and the parent removal are part of the same record.
+		journal._quiet += 1
+
+		try:
+			super().free()
+		finally:
+			journal._quiet -= 1
+
+		journal._freed(self, subtree)
+
+
+	def sort_children(self, key = None, reverse: "bool" = False) -> None:
+		positions: dict[int, int] = {id(child): index for index, child in enumerate(self._childrens)}
+		super().sort_children(key, reverse)
+		journal: Union[TreeJournal, None] = self._recording()
+
+		if (journal != None):
+			journal._write(_RECORD_REORDER, self._journal_id, [positions[id(child)] for child in self._childrens])
+
+
+	def reorder_children(self, permutation: "list[int]") -> None:
+		super().reorder_children(permutation)
+		journal: Union[TreeJournal, None] = self._recording()
+
+		if (journal != None):
+			journal._write(_RECORD_REORDER, self._journal_id, list(permutation))
+
+
+# -------------------------------------------------
+
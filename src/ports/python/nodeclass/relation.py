@@ -0,0 +1,474 @@
+"""
+Relation Node,
+allow chained objects in a graph pattern.
+
+Each node can have multiple parents and multiple childrens,
+the connections can never form a cycle.
+
+- since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+from typing import Union
+from collections import deque
+
+
+# -------------------------------------------------
+
+
+class RelationNode():
+	"""
+	The Node class object, it allow to connect and be connected with multiple other nodes.
+
+	When a connection happen the child get the reference of the parent and the parent get the reference of the child, both are stored inside sets so connections can be checked in constant time.
+
+	Each node keep a level greater than the level of all his parents, a new connection that respect the levels is accepted immediately,
+	otherwise only the nodes whose level must be raised are visited to find if the connection would create a cycle.
+
+	- Since: 1.1
+	"""
+
+
+	_version: int = 0
+	"""
+	Increased every time a connection between any nodes is changed, used to know when cached results are outdated.
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, name: "str" = "Node") -> None:
+		self._parents: set[RelationNode] = set()
+		self._childrens: set[RelationNode] = set()
+		self._name: str = name
+		self._level: int = 0
+		self._order: Union[tuple, None] = None
+
+
+	def __repr__(self) -> "str":
+		return self.repr()
+
+
+	def __iter__(self) -> "RelationNode":
+
+		for child in self._childrens:
+			yield child
+
+
+	def __len__(self) -> "int":
+		return len(self._childrens)
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def parents(self) -> set["RelationNode"]:
+		"""
+		The set of Node objects wich the current Node is child of.
+
+		The property is stored as `_parents`, if you edit it directly it may cause desync between Nodes.
+
+		- Since: 1.1
+		"""
+
+		return self._parents
+
+
+	@property
+	def childrens(self) -> set["RelationNode"]:
+		"""
+		The set of Node objects wich are childrens of the current Node.
+
+		The property is stored as `_childrens`, if you edit it directly it may cause desync between Nodes.
+
+		- Since: 1.1
+		"""
+
+		return self._childrens
+
+
+	@property
+	def name(self) -> "str":
+		"""
+		The name of the current Node, unlike the other structures it does not need to be unique.
+
+		- Since: 1.1
+		"""
+
+		return self._name
+
+
+	@name.setter
+	def name(self, name: "str") -> None:
+		self.rename(name)
+
+
+	# -------------------------------------------------
+
+
+	def _free(self) -> None:
+		"""
+		Executed before the current Node remove all references to itself to any other Node is connected to it.
+
+		- Virtual
+		- Since: 1.1
+		"""
+
+		pass
+
+
+	def _renamed(self) -> None:
+		"""
+		Executed after the current Node has been renamed with `rename`.
+
+		- Virtual
+		- Since: 1.1
+		"""
+
+		pass
+
+
+	def _add_parent(self, parent: "RelationNode") -> None:
+		"""
+		Executed after the current Node has been connected to a new parent.
+
+		Params:
+			`parent` Node: The parent just added.
+
+		- Virtual
+		- Since: 1.1
+		"""
+
+		pass
+
+
+	def _removed_parent(self, parent: "RelationNode") -> None:
+		"""
+		Executed after the current Node has been disconnected from a parent.
+
+		Params:
+			`parent` Node: The parent just removed.
+
+		- Virtual
+		- Since: 1.1
+		"""
+
+		pass
+
+
+	def _add_child(self, child: "RelationNode") -> None:
+		"""
+		Executed after a new node has been connected as a child.
+
+		Params:
+			`child` Node: The child just added.
+
+		- Virtual
+		- Since: 1.1
+		"""
+
+		pass
+
+
+	def _removed_child(self, child: "RelationNode") -> None:
+		"""
+		Executed after a node has been disconnected from being a child.
+
+		Params:
+			`child` Node: The child just removed.
+
+		- Virtual
+		- Since: 1.1
+		"""
+
+		pass
+
+
+	# -------------------------------------------------
+
+
+	def free(self) -> None:
+		"""
+		Will help you to remove all references of the current Node from any connection.
+
+		Here the order of what will happen when executed:
+		1. Will execute the `_free` virtual.
+		2. Will disconnect from all the childrens.
+		3. Will disconnect from all the parents.
+
+		Unlike the other structures the childrens are not freed, because they may be connected to other parents.
+
+		After that you can destroy the object with no problem.
+		- Since: 1.1
+		"""
+
+		self._free()
+
+		for child in tuple(self._childrens):
+			self.remove_child(child)
+
+		for parent in tuple(self._parents):
+			parent.remove_child(self)
+
+
+	def rename(self, name: "str") -> None:
+		"""
+		Will change the name of the current node and execute the `_renamed` virtual after.
+
+		Params:
+			`name` str: The new desired name.
+
+		- Since: 1.1
+		"""
+
+		self._name = name
+		self._renamed()
+
+
+	def add_child(self, node: "RelationNode") -> None:
+		"""
+		Connect the input Node as a child of the current Node, virtual methods are executed.
+
+		If the Node is invalid, already a child or the connection would create a cycle an exception will throw.
+
+		Params:
+			`node` Node: The new child.
+
+		- Since: 1.1
+		"""
+
+		if (isinstance(node, RelationNode) == False):
+			raise Exception("Tried to add class type '{type}' instead of '{node}' base class.".format(
+				type = type(node).__name__,
+				node = type(self).__name__
+			))
+
+		if (node == self):
+			raise Exception("You can't parent a Node with itself.")
+
+		if (node in self._childrens):
+			raise Exception("Tried to add as a child a Node already connected to the current Node.")
+
+		if (node._level <= self._level):
+			self._raise_levels(node)
+
+		self._childrens.add(node)
+		node._parents.add(self)
+		RelationNode._version += 1
+		node._add_parent(self)
+		self._add_child(node)
+
+
+	def remove_child(self, child: "RelationNode") -> None:
+		"""
+		Disconnect the input Node from being a child of the current Node, virtual methods are executed.
+
+		If the input Node is not a child of the current Node an exception will throw.
+
+		Params:
+			`child` Node: The child to remove.
+
+		- Since: 1.1
+		"""
+
+		if ((isinstance(child, RelationNode) == False) or ((child in self._childrens) == False)):
+			raise Exception("Tried to remove a Node wich isn't connected to the current Node.")
+
+		self._childrens.remove(child)
+		child._parents.remove(self)
+		RelationNode._version += 1
+		child._removed_parent(self)
+		self._removed_child(child)
+
+
+	def add_parent(self, node: "RelationNode") -> None:
+		"""
+		Connect the current Node as a child of the input Node, same as `node.add_child(self)`.
+
+		- Since: 1.1
+		"""
+
+		if (isinstance(node, RelationNode) == False):
+			raise Exception("Tried to add class type '{type}' instead of '{node}' base class.".format(
+				type = type(node).__name__,
+				node = type(self).__name__
+			))
+
+		node.add_child(self)
+
+
+	def remove_parent(self, parent: "RelationNode") -> None:
+		"""
+		Disconnect the current Node from being a child of the input Node, same as `parent.remove_child(self)`.
+
+		- Since: 1.1
+		"""
+
+		if ((isinstance(parent, RelationNode) == False) or ((parent in self._parents) == False)):
+			raise Exception("Tried to remove a Node wich isn't connected to the current Node.")
+
+		parent.remove_child(self)
+
+
+	def _raise_levels(self, node: "RelationNode") -> None:
+		"""
+		Raise the level of node and of the nodes after it so they are greater than the level of the current Node.
+
+		If the current Node is reached the connection would create a cycle, the levels are restored and an exception will throw.
+		"""
+
+		changed: list[tuple[RelationNode, int]] = [(node, node._level)]
+		node._level = self._level + 1
+		stack: list[RelationNode] = [node]
+
+		while(len(stack) > 0):
+			current: RelationNode = stack.pop()
+
+			for child in current._childrens:
+
+				if (child == self):
+
+					for n, level in reversed(changed):
+						n._level = level
+
+					raise Exception("The connection would create a cycle.")
+
+				if (child._level <= current._level):
+					changed.append((child, child._level))
+					child._level = current._level + 1
+					stack.append(child)
+
+
+	# -------------------------------------------------
+
+
+	def has_child(self, node: "RelationNode") -> "bool":
+		"""
+		Check if the input Node is directly connected as a child of the current Node.
+
+		- Since: 1.1
+		"""
+
+		return node in self._childrens
+
+
+	def has_parent(self, node: "RelationNode") -> "bool":
+		"""
+		Check if the input Node is directly connected as a parent of the current Node.
+
+		- Since: 1.1
+		"""
+
+		return node in self._parents
+
+
+	def is_reachable(self, node: "RelationNode") -> "bool":
+		"""
+		Check if the input Node can be reached by following the childrens of the current Node.
+
+		Nodes with a level greater or equal to the input Node are never visited because they can't reach it.
+
+		- Since: 1.1
+		"""
+
+		if (node == self):
+			return True
+
+		if (node._level <= self._level):
+			return False
+
+		seen: set[RelationNode] = {self}
+		stack: list[RelationNode] = [self]
+
+		while(len(stack) > 0):
+
+			for child in stack.pop()._childrens:
+
+				if (child == node):
+					return True
+
+				if ((child._level < node._level) and ((child in seen) == False)):
+					seen.add(child)
+					stack.append(child)
+
+		return False
+
+
+	def walk_childrens(self, depth_first: "bool" = False) -> "RelationNode":
+		"""
+		Lazily iterate all the nodes reachable by following the childrens of the current Node, each node is given once.
+
+		Params:
+			`depth_first` (bool): Will follow each path to the end before the next one, by default all the nodes closer to the current Node are given first.
+
+		- Since: 1.1
+		"""
+
+		return self._walk("_childrens", depth_first)
+
+
+	def walk_parents(self, depth_first: "bool" = False) -> "RelationNode":
+		"""
+		Lazily iterate all the nodes reachable by following the parents of the current Node, each node is given once.
+
+		Params:
+			`depth_first` (bool): Will follow each path to the end before the next one, by default all the nodes closer to the current Node are given first.
+
+		- Since: 1.1
+		"""
+
+		return self._walk("_parents", depth_first)
+
+
+	def _walk(self, links: "str", depth_first: "bool") -> "RelationNode":
+		seen: set[RelationNode] = {self}
+		pending: deque = deque([self])
+		take = pending.pop if (depth_first == True) else pending.popleft
+
+		while(len(pending) > 0):
+
+			for node in getattr(take(), links):
+
+				if ((node in seen) == False):
+					seen.add(node)
+					pending.append(node)
+					yield node
+
+
+	def get_topological_order(self) -> tuple["RelationNode"]:
+		"""
+		Get the current Node and all the nodes reachable by following his childrens, ordered so each parent is before his childrens.
+
+		The order is computed the first time it is requested and kept until any connection is changed.
+
+		- Since: 1.1
+		"""
+
+		if ((self._order == None) or (self._order[0] != RelationNode._version)):
+			nodes: list[RelationNode] = [self, *self.walk_childrens()]
+			nodes.sort(key = lambda node: node._level)
+			self._order = (RelationNode._version, tuple(nodes))
+
+		return self._order[1]
+
+
+	def repr(self) -> "str":
+		"""
+		Convert the current Node into a string.
+
+		Returns:
+			The string with a rappresentation of the current Node.
+
+		- Since: 1.1
+		"""
+
+		return "<{node_class}:'{node_name}'>".format(node_class = type(self).__name__, node_name = self._name)
+
+
+# -------------------------------------------------
+
@@ -0,0 +1,444 @@
+"""
+Shared Tree,
+share a read-only copy of a tree between processes.
+
+The tree is stored as flat arrays inside a shared memory segment,
+any process can attach it and navigate it without loading a copy.
+
+- since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+from typing import Union
+from array import array
+from collections import deque
+from multiprocessing.shared_memory import SharedMemory
+
+from nodeclass.tree import TreeNode, NODE_NO_INDEX
+
+
+# -------------------------------------------------
+
+
+SHARED_TREE_MAGIC: "bytes" = b"NCST0001"
+"""
+The bytes at the begin of a shared memory segment created by `export_shared`.
+
+- Since: 1.1
+"""
+
+
+_HEADER_SIZE: int = 24
+_ITEM_SIZE: int = 8
+
+
+# -------------------------------------------------
+
+
+def export_shared(root: "TreeNode", name: "str" = None) -> "SharedMemory":
+	"""
+	Copy the tree of root inside a new shared memory segment.
+
+	The nodes are stored in level order, so the childrens of each node are next to each other, with these arrays:
+	- parent: The position of the parent or -1 for the root.
+	- first child: The position of the first child.
+	- child count: The amount of childrens.
+	- name offsets: The position of each name inside the string blob, followed by the end of the blob.
+
+	The segment is owned by the caller, who must `close` and `unlink` it when the workers don't need it anymore.
+
+	Params:
+		`root` (TreeNode): The top-level Node of the tree to export.
+		`name` (str): Optional name of the segment, by default a random name is used.
+
+	Returns:
+		The shared memory segment, his `name` is used by `attach_shared`.
+
+	- Since: 1.1
+	"""
+
+	parents: array = array("q")
+	first_childs: array = array("q")
+	child_counts: array = array("q")
+	offsets: array = array("q", [0])
+	blob: bytearray = bytearray()
+	queue: deque = deque([(root, -1)])
+
+	while(len(queue) > 0):
+		node, parent = queue.popleft()
+		index: int = len(parents)
+
+		parents.append(parent)
+		first_childs.append(index + len(queue) + 1)
+		child_counts.append(len(node._childrens))
+		blob += node._name.encode("utf-8")
+		offsets.append(len(blob))
+
+		for child in node._childrens:
+			queue.append((child, index))
+
+	count: int = len(parents)
+	size: int = _HEADER_SIZE + (count * 4 + 1) * _ITEM_SIZE + len(blob)
+	memory: SharedMemory = SharedMemory(name = name, create = True, size = size)
+	buffer: memoryview = memory.buf
+	position: int = _HEADER_SIZE
+
+	buffer[0:8] = SHARED_TREE_MAGIC
+	buffer[8:16] = count.to_bytes(8, "little")
+	buffer[16:24] = len(blob).to_bytes(8, "little")
+
+	for values in (parents, first_childs, child_counts, offsets):
+		data: bytes = values.tobytes()
+		buffer[position:position + len(data)] = data
+		position += len(data)
+
+	buffer[position:position + len(blob)] = blob
+	del buffer
+	return memory
+
+
+def attach_shared(name: "str") -> "SharedTree":
+	"""
+	Attach to a tree exported by `export_shared` in any process.
+
+	Params:
+		`name` (str): The name of the shared memory segment.
+
+	Returns:
+		The shared tree, his `root` is the first node to navigate.
+
+	- Since: 1.1
+	"""
+
+	return SharedTree(SharedMemory(name = name))
+
+
+# -------------------------------------------------
+
+
+class SharedTree():
+	"""
+	A read-only tree stored inside a shared memory segment, the arrays are read directly from the segment without any copy.
+
+	Call `close` when the tree is not used anymore, it can also be used with the `with` statement.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, memory: "SharedMemory") -> None:
+		buffer: memoryview = memory.buf.toreadonly()
+
+		if (bytes(buffer[0:8]) != SHARED_TREE_MAGIC):
+			buffer.release()
+			raise Exception("The shared memory '{name}' does not contain a tree.".format(
+				name = memory.name
+			))
+
+		count: int = int.from_bytes(buffer[8:16], "little")
+		size: int = int.from_bytes(buffer[16:24], "little")
+		position: int = _HEADER_SIZE
+		views: list[memoryview] = []
+
+		for length in (count, count, count, count + 1):
+			views.append(buffer[position:position + length * _ITEM_SIZE].cast("q"))
+			position += length * _ITEM_SIZE
+
+		self._memory: SharedMemory = memory
+		self._buffer: memoryview = buffer
+		self._count: int = count
+		self._parents: memoryview = views[0]
+		self._first_childs: memoryview = views[1]
+		self._child_counts: memoryview = views[2]
+		self._offsets: memoryview = views[3]
+		self._blob: memoryview = buffer[position:position + size]
+
+
+	def __enter__(self) -> "SharedTree":
+		return self
+
+
+	def __exit__(self, *exception) -> None:
+		self.close()
+
+
+	def __len__(self) -> "int":
+		return self._count
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def root(self) -> "SharedTreeNode":
+		"""
+		The top-level node of the tree.
+
+		- Since: 1.1
+		"""
+
+		return SharedTreeNode(self, 0)
+
+
+	@property
+	def name(self) -> "str":
+		"""
+		The name of the shared memory segment.
+
+		- Since: 1.1
+		"""
+
+		return self._memory.name
+
+
+	# -------------------------------------------------
+
+
+	def close(self) -> None:
+		"""
+		Release the views of the arrays and close the shared memory segment, the nodes can't be used after.
+
+		- Since: 1.1
+		"""
+
+		for view in (self._parents, self._first_childs, self._child_counts, self._offsets, self._blob, self._buffer):
+			view.release()
+
+		self._memory.close()
+
+
+# -------------------------------------------------
+
+
+class SharedTreeNode():
+	"""
+	A light read-only view of a node inside a `SharedTree`, it offer the navigation methods of `TreeNode`.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, tree: "SharedTree", index: "int") -> None:
+		self._tree: SharedTree = tree
+		self._index: int = index
+
+
+	def __repr__(self) -> "str":
+		return self.repr()
+
+
+	def __eq__(self, other: object) -> "bool":
+		return (isinstance(other, SharedTreeNode) == True) and (other._tree == self._tree) and (other._index == self._index)
+
+
+	def __hash__(self) -> "int":
+		return hash((id(self._tree), self._index))
+
+
+	def __iter__(self) -> "SharedTreeNode":
+		first: int = self._tree._first_childs[self._index]
+
+		for index in range(first, first + self._tree._child_counts[self._index]):
+			yield SharedTreeNode(self._tree, index)
+
+
+	def __len__(self) -> "int":
+		return self._tree._child_counts[self._index]
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def tree(self) -> "SharedTree":
+		"""
+		The shared tree wich contain the current node.
+
+		- Since: 1.1
+		"""
+
+		return self._tree
+
+
+	@property
+	def parent(self) -> Union["SharedTreeNode", None]:
+		"""
+		The node wich the current node is child of.
+
+		- Since: 1.1
+		"""
+
+		parent: int = self._tree._parents[self._index]
+		return None if (parent < 0) else SharedTreeNode(self._tree, parent)
+
+
+	@property
+	def childrens(self) -> tuple["SharedTreeNode"]:
+		"""
+		The nodes wich are childrens of the current node.
+
+		- Since: 1.1
+		"""
+
+		return tuple(self)
+
+
+	@property
+	def name(self) -> "str":
+		"""
+		The name of the current node.
+
+		- Since: 1.1
+		"""
+
+		offsets: memoryview = self._tree._offsets
+		return str(self._tree._blob[offsets[self._index]:offsets[self._index + 1]], "utf-8")
+
+
+	# -------------------------------------------------
+
+
+	def get_index(self) -> "int":
+		"""
+		Get the index position inside the parent childrens of the current node.
+
+		Returns:
+			The index position of the current node or `NODE_NO_INDEX` if no parent exist.
+
+		- Since: 1.1
+		"""
+
+		parent: int = self._tree._parents[self._index]
+		return NODE_NO_INDEX if (parent < 0) else self._index - self._tree._first_childs[parent]
+
+
+	def get_root(self) -> "SharedTreeNode":
+		"""
+		The top-level node of the tree.
+
+		- Since: 1.1
+		"""
+
+		return SharedTreeNode(self._tree, 0)
+
+
+	def get_path(self) -> tuple["SharedTreeNode"]:
+		"""
+		Get all the nodes between the root and the current node.
+
+		- Since: 1.1
+		"""
+
+		path: list[SharedTreeNode] = []
+		index: int = self._tree._parents[self._index]
+
+		while(index >= 0):
+			path.append(SharedTreeNode(self._tree, index))
+			index = self._tree._parents[index]
+
+		return tuple(reversed(path))
+
+
+	def get_child_count(self) -> "int":
+		"""
+		Will give the total amount of childrens of the current node.
+
+		- Since: 1.1
+		"""
+
+		return self._tree._child_counts[self._index]
+
+
+	def get_child(self, *path: Union["int", "str"]) -> Union["SharedTreeNode", None]:
+		"""
+		Will find a node from the current node, same as `TreeNode.get_child`.
+
+		Params:
+			`path` (int|string)
+
+		Returns:
+			The found node or `None` if not found.
+
+		- Since: 1.1
+		"""
+
+		tree: SharedTree = self._tree
+		current: int = self._index
+
+		for p in path:
+			first: int = tree._first_childs[current]
+			c_size: int = tree._child_counts[current]
+
+			if (isinstance(p, int) == True):
+
+				if (p < 0):
+					p += c_size
+
+				if ((p < 0) or (p >= c_size)):
+					return None
+
+				current = first + p
+
+			elif (isinstance(p, str) == True):
+				name: bytes = p.encode("utf-8")
+				offsets: memoryview = tree._offsets
+
+				for index in range(first, first + c_size):
+
+					if (tree._blob[offsets[index]:offsets[index + 1]] == name):
+						current = index
+						break
+				else:
+					return None
+
+			else:
+				raise Exception("Invalid type '{type}' used in path.".format(
+					type = type(p).__name__
+				))
+
+		return None if (len(path) == 0) else SharedTreeNode(tree, current)
+
+
+	def iter_events(self) -> tuple["int", "str"]:
+		"""
+		Lazily iterate the childrens and sub-childrens of the current node as `(depth, name)` events, same as `TreeNode.iter_events`.
+
+		- Since: 1.1
+		"""
+
+		stack: list = [iter(self)]
+
+		while(len(stack) > 0):
+			node: SharedTreeNode = next(stack[-1], None)
+
+			if (node == None):
+				stack.pop()
+				continue
+
+			yield (len(stack) - 1, node.name)
+
+			if (len(node) > 0):
+				stack.append(iter(node))
+
+
+	def repr(self) -> "str":
+		"""
+		Convert the current node into a string.
+
+		- Since: 1.1
+		"""
+
+		return "<{node_class}:'{node_name}'>".format(node_class = type(self).__name__, node_name = self.name)
+
+
+# -------------------------------------------------
+
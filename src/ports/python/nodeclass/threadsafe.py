@@ -0,0 +1,197 @@
+"""
+Thread-Safe Tree Node,
+allow multiple threads to change the same tree.
+
+Each node has his own lock, so threads changing different
+subtrees never wait for each other.
+
+- since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+from typing import Any, Union
+from threading import RLock
+from contextlib import contextmanager
+
+from nodeclass.tree import TreeNode
+
+
+# -------------------------------------------------
+
+
+def _node_lock(node: "TreeNode") -> "RLock":
+	"""
+	Get the lock of node, it is created the first time it is requested.
+	"""
+
+	lock: Union[RLock, None] = node.__dict__.get("_lock")
+
+	# `setdefault` is atomic, if two threads create a lock only one is kept.
+	if (lock == None):
+		lock = node.__dict__.setdefault("_lock", RLock())
+
+	return lock
+
+
+@contextmanager
+def _locked(*nodes: Union["TreeNode", None]) -> Any:
+	"""
+	Hold the locks of the nodes in the given order, missing nodes are skipped.
+	"""
+
+	locks: list[RLock] = [_node_lock(node) for node in nodes if (node != None)]
+
+	for lock in locks:
+		lock.acquire()
+
+	try:
+		yield
+	finally:
+
+		for lock in reversed(locks):
+			lock.release()
+
+
+# -------------------------------------------------
+
+
+class ThreadSafeTreeNode(TreeNode):
+	"""
+	A `TreeNode` whose changes can be executed by multiple threads at the same time.
+
+	Every change hold the lock of the Node whose childrens change and then the lock of the child whose parent change,
+	locks are always taken from the parent to the child, so two threads never wait for each other in a cycle.
+	A change is checked again once the locks are held, so a parent replaced by another thread meanwhile is never used.
+
+	Readers can hold `locked` to see the childrens of a Node and their parent only before or after a change, never in the middle.
+
+	Aggregates and `TreeBuilder` are not protected, use them when no other thread is changing the same tree.
+
+	- Since: 1.1
+	"""
+
+
+	_structure_keys: frozenset[str] = TreeNode._structure_keys | frozenset(("_lock",))
+	"""
+	The attributes that describe the connections of a Node, they are not copied as extra state when the tree is pickled.
+	"""
+
+
+	# -------------------------------------------------
+
+
+	@contextmanager
+	def locked(self) -> Any:
+		"""
+		Hold the lock of the current Node inside a `with` statement, his childrens list and their parent can't be changed by other threads meanwhile.
+
+		The lock is reentrant, the current thread can still change the Node.
+
+		- Since: 1.1
+		"""
+
+		with _locked(self):
+			yield self
+
+
+	# -------------------------------------------------
+
+
+	def rename(self, name: "str") -> None:
+
+		while(True):
+			parent: Union[TreeNode, None] = self._parent
+
+			# The siblings of the parent are checked for the unique name.
+			with _locked(parent, self):
+
+				if (self._parent == parent):
+					super().rename(name)
+					return
+
+
+	def free(self) -> None:
+
+		if (self.is_loaded() == True):
+
+			for c in tuple(self._childrens):
+				c.free()
+
+		self._free()
+		self._detach()
+
+
+	def remove(self) -> None:
+
+		if (self._detach() == False):
+			raise Exception("The current Node is not parented whit a Node.")
+
+
+	def _detach(self) -> "bool":
+		"""
+		Remove the current Node from his parent, `False` is returned if no parent exist.
+		"""
+
+		while(True):
+			parent: Union[TreeNode, None] = self._parent
+
+			if (parent == None):
+				return False
+
+			with _locked(parent, self):
+
+				if (self._parent == parent):
+					parent.remove_child(self)
+					return True
+
+
+	def move(self, index: "int") -> None:
+
+		while(True):
+			parent: Union[TreeNode, None] = self._parent
+
+			if (parent == None):
+				raise Exception("The current Node is not parented whit a Node.")
+
+			with _locked(parent, self):
+
+				if (self._parent == parent):
+					parent.move_child(self, index)
+					return
+
+
+	def add_child(self, node: "TreeNode", index: "int" = -1) -> None:
+
+		with _locked(self, node if (isinstance(node, TreeNode) == True) else None):
+			super().add_child(node, index)
+
+
+	def remove_child(self, child: "TreeNode") -> None:
+
+		with _locked(self, child if (isinstance(child, TreeNode) == True) else None):
+			super().remove_child(child)
+
+
+	def move_child(self, child: "TreeNode", index: "int") -> None:
+
+		with _locked(self, child if (isinstance(child, TreeNode) == True) else None):
+			super().move_child(child, index)
+
+
+	def sort_children(self, key = None, reverse: "bool" = False) -> None:
+
+		with _locked(self):
+			super().sort_children(key, reverse)
+
+
+	def reorder_children(self, permutation: "list[int]") -> None:
+
+		with _locked(self):
+			super().reorder_children(permutation)
+
+
+# -------------------------------------------------
+
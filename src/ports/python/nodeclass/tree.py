@@ -12,7 +12,12 @@ ordered in a hierarchy starting from a single node called root.
 # -------------------------------------------------
 
 
-from typing import Union
+from typing import Union, Callable
+from weakref import ref as weak_ref
+from collections import deque
+from hashlib import blake2b
+
+from nodeclass.childlist import ChildList, LazyChildList, LoaderPool
 
 
 # -------------------------------------------------
@@ -26,6 +31,22 @@ The index of a Node with no parent.
 """
 
 
+NODE_VISIT_SKIP: "int" = 1
+"""
+Returned by a `visit` callback to avoid visiting the childrens of the current Node.
+
+- Since: 1.1
+"""
+
+
+NODE_VISIT_STOP: "int" = 2
+"""
+Returned by a `visit` callback to end the traversal.
+
+- Since: 1.1
+"""
+
+
 # -------------------------------------------------
 
 
@@ -53,6 +74,51 @@ class NodeWalkIterator():
 # -------------------------------------------------
 
 
+def _get_weak_parent(node: "TreeNode") -> Union["TreeNode", None]:
+	reference = node._parent_ref
+	return None if (reference == None) else reference()
+
+
+def _set_weak_parent(node: "TreeNode", parent: Union["TreeNode", None]) -> None:
+	node._parent_ref = None if (parent == None) else weak_ref(parent)
+
+
+def _load_tree(classes: tuple[type], kinds: list[int], names: list[str], parents: list[int]) -> "TreeNode":
+	"""
+	Rebuild a tree encoded by `TreeNode.__reduce__` and return the root, the nodes are listed from the root in walk order.
+	"""
+
+	nodes: list[TreeNode] = []
+
+	for kind, name, parent in zip(kinds, names, parents):
+		node: TreeNode = classes[kind].__new__(classes[kind])
+		TreeNode.__init__(node, name)
+
+		if (parent >= 0):
+			node._parent = nodes[parent]
+			nodes[parent]._childrens.append(node)
+
+		nodes.append(node)
+
+	return nodes[0]
+
+
+def _find_tree_node(root: "TreeNode", path: tuple[int]) -> "TreeNode":
+	"""
+	Get the node of a tree rebuilt by `_load_tree` from the index position of each node between the root and the node.
+	"""
+
+	node: TreeNode = root
+
+	for index in path:
+		node = node._childrens[index]
+
+	return node
+
+
+# -------------------------------------------------
+
+
 class TreeNode():
 	"""
 	The Node class object, it allow to connect and be connected with other nodes.
@@ -65,6 +131,32 @@ class TreeNode():
 	"""
 
 
+	_structure_keys: frozenset[str] = frozenset(("_parent", "_parent_ref", "_childrens", "_name", "_aggregate_cache"))
+	"""
+	The attributes that describe the connections of a Node, they are not copied as extra state when the tree is pickled.
+	"""
+
+	_aggregate_reducers: dict[str, tuple[Callable, Callable]] = {}
+	"""
+	The functions of each aggregate registered with `register_aggregate`.
+	"""
+
+	_aggregate_cache: Union[dict, None] = None
+	"""
+	The aggregates already computed for the current Node, `None` when they must be computed again.
+	"""
+
+	_child_list_type: type = ChildList
+	"""
+	The container used for the childrens once they are more than `_child_list_threshold`, it must offer the list operations used by the Node.
+	"""
+
+	_child_list_threshold: int = 4096
+	"""
+	The amount of childrens after wich the plain list is replaced by `_child_list_type` when a child is added, removed or moved.
+	"""
+
+
 	# -------------------------------------------------
 
 
@@ -74,6 +166,26 @@ class TreeNode():
 		self._name: str = name
 
 
+	def __init_subclass__(cls, weak_parent: "bool" = None, **kwargs) -> None:
+		"""
+		Allow a subclass to choose how the parent reference is stored, `class MyNode(TreeNode, weak_parent = True)`.
+
+		The childrens keep a weak reference to their parent, so the tree is owned by the root and dropping the root free the whole structure without the cyclic garbage collector.
+
+		Params:
+			`weak_parent` (bool): If enabled the parent is stored as a weak reference, if disabled as a normal reference, by default it is inherited.
+
+		- Since: 1.1
+		"""
+
+		super().__init_subclass__(**kwargs)
+
+		if (weak_parent == True):
+			cls._parent = property(_get_weak_parent, _set_weak_parent)
+		elif (weak_parent == False):
+			cls._parent = None
+
+
 	def __repr__(self) -> "str":
 		return self.repr()
 	
@@ -88,6 +200,74 @@ class TreeNode():
 		return len(self._childrens)
 
 
+	def __reduce__(self) -> "tuple":
+		"""
+		Allow `pickle` and `copy` to save the whole tree of the current Node without recursion.
+
+		The root is encoded as flat lists of classes, names and parent index positions in walk order,
+		the attributes added by subclasses are saved as extra state of each node.
+
+		Any other Node is encoded as the root and the path to reach it, so a tree is stored only once.
+
+		- Since: 1.1
+		"""
+
+		root: TreeNode = self.get_root()
+
+		if (root != self):
+			path: list[int] = []
+			node: TreeNode = self
+
+			while(node._parent != None):
+				path.append(node._parent._childrens.index(node))
+				node = node._parent
+
+			return (_find_tree_node, (root, tuple(reversed(path))))
+
+		classes: dict[type, int] = {}
+		kinds: list[int] = []
+		names: list[str] = []
+		parents: list[int] = []
+		states: dict[int, dict] = {}
+		stack: list[tuple[TreeNode, int]] = [(self, -1)]
+
+		while(len(stack) > 0):
+			node, parent = stack.pop()
+			index: int = len(names)
+			kind: int = classes.setdefault(type(node), len(classes))
+			if ((node.__dict__.keys() <= node._structure_keys) == False):
+				states[index] = {key: value for key, value in node.__dict__.items() if ((key in node._structure_keys) == False)}
+
+			kinds.append(kind)
+			names.append(node._name)
+			parents.append(parent)
+
+			for child in reversed(node._childrens):
+				stack.append((child, index))
+
+		return (_load_tree, (tuple(classes), kinds, names, parents), states if (len(states) > 0) else None)
+
+
+	def __setstate__(self, states: dict[int, dict]) -> None:
+		"""
+		Restore the extra state of the nodes of a tree loaded by `pickle` or `copy`.
+
+		- Since: 1.1
+		"""
+
+		stack: list[TreeNode] = [self]
+		index: int = 0
+
+		while(len(stack) > 0):
+			node: TreeNode = stack.pop()
+
+			if (index in states):
+				node.__dict__.update(states[index])
+
+			stack.extend(reversed(node._childrens))
+			index += 1
+
+
 	# -------------------------------------------------
 
 
@@ -196,6 +376,30 @@ class TreeNode():
 		pass
 
 
+	def _hash_state(self) -> "bytes":
+		"""
+		Give the state of a subclass to include inside the structure hash of the current Node, by default nothing is included.
+
+		When the state change `invalidate_aggregates` must be executed.
+
+		- Virtual
+		- Since: 1.1
+		"""
+
+		return b""
+
+
+	def _reordered_childrens(self) -> None:
+		"""
+		Executed once after the childrens list has been rearranged by `sort_children` or `reorder_children`.
+
+		- Virtual
+		- Since: 1.1
+		"""
+
+		pass
+
+
 	# -------------------------------------------------
 	
 	
@@ -212,8 +416,11 @@ class TreeNode():
 		- Since: 1.0
 		"""
 		
-		for c in tuple(self._childrens):
-			c.free()
+		# Childrens not given by a loader yet have nothing to free.
+		if (self.is_loaded() == True):
+
+			for c in tuple(self._childrens):
+				c.free()
 
 		self._free()
 
@@ -225,7 +432,8 @@ class TreeNode():
 		"""
 		Will change the name of the current node and execute the `_renamed` virtual after.
 
-		If the name is already used by another child it will start a counter to find an new unique name.
+		If the name is already used by another child it will start a counter to find an new unique name,
+		once the childrens of the parent are a `ChildList` his name index is used instead of comparing every child.
 
 		Params:
 			`name` str: The new desired name.
@@ -233,27 +441,23 @@ class TreeNode():
 		- Since: 1.0
 		"""
 
-		if (self._parent != None):
+		if ((self._parent != None) and (isinstance(self._parent._childrens, ChildList) == True)):
+			name = self._parent._childrens.claim_name(self, name)
+
+		elif (self._parent != None):
+			# The names of the siblings are collected once, so each counter is checked without walking them again.
+			used: set[str] = {child._name for child in self._parent._childrens if (child != self)}
 			fix_name: str = name
 			count: int = 0
 
-			while(True):
-				found: bool = False
-
-				for child in self._parent._childrens:
+			while(fix_name in used):
+				count += 1
+				fix_name = f"{name}{count}"
 
-					if ((child != self) and (fix_name == child._name)):
-						found = True
-						break
-				
-				if (found == True):
-					count += 1
-					fix_name = f"{name}{count}"
-				else:
-					name = fix_name
-					break
+			name = fix_name
 		
 		self._name = name
+		self.invalidate_aggregates()
 		self._renamed()
 
 
@@ -325,8 +529,10 @@ class TreeNode():
 			else:
 				index = c_size + index + 1
 		
+		self._scale_childrens()
 		self._childrens.insert(index, node)
 		node._parent = self
+		self.invalidate_aggregates()
 		node.rename(node._name)	# Make sure to update name.
 		node._changed_parent()
 		self._add_child(node)
@@ -354,7 +560,9 @@ class TreeNode():
 			raise Exception("Tried to remove a Node wich isn't connected to the current Node.")
 		
 		child._parent = None
+		self._scale_childrens()
 		del self._childrens[self._childrens.index(child)]
+		self.invalidate_aggregates()
 		child._changed_parent()
 		self._removed_child(child)
 
@@ -381,170 +589,513 @@ class TreeNode():
 		if (child._parent != self):
 			raise Exception("Tried to move a Node wich isn't connected to the current Node.")
 		
+		self._scale_childrens()
 		del self._childrens[self._childrens.index(child)]
 		self._childrens.insert(index, child)
+		self.invalidate_aggregates()
 
 
-	# -------------------------------------------------
+	def _scale_childrens(self) -> None:
+		"""
+		Replace the plain list of childrens with `_child_list_type` when they are more than `_child_list_threshold`,
+		so inserting, removing and finding a child does not need to shift or search the whole list.
+		"""
 
+		if ((type(self._childrens) == list) and (len(self._childrens) > self._child_list_threshold)):
+			self._childrens = self._child_list_type(self._childrens)
 
-	def get_index(self) -> "int":
+
+	def sort_children(self, key = None, reverse: "bool" = False) -> None:
 		"""
-		Get the index position inside the parent list of the current Node.
-		
-		Returns:
-			The index position of the curret Node or `NODE_NO_INDEX` if no parent exist.
+		Will sort the childrens list of the current Node in a single pass and execute the `_reordered_childrens` virtual after.
+
+		Params:
+			`key` (callable): Optional function that give the sort value of a child, by default the name is used.
+			`reverse` (bool): Will sort from the biggest to the smallest value.
 		
-		- Since: 1.0
+		- Since: 1.1
 		"""
-		
-		return NODE_NO_INDEX if (self._parent == None) else self._parent._childrens.index(self)
 
+		if (key == None):
+			key = lambda node: node._name
 
-	def get_root(self) -> "TreeNode":
-		"""
-		Will get the top-level Node wich is parented with all the Nodes of the current tree.
+		self._childrens.sort(key = key, reverse = reverse)
+		self.invalidate_aggregates()
+		self._reordered_childrens()
 
-		- Since: 1.0
+
+	def reorder_children(self, permutation: "list[int]") -> None:
 		"""
+		Will rearrange the childrens list of the current Node in a single pass and execute the `_reordered_childrens` virtual after.
 
-		node: TreeNode = self
+		The child at position `permutation[i]` will be moved to position `i`.
 
-		while(node._parent != None):
-			node = node._parent
+		If the permutation does not contain every index of the childrens list exactly once an exception will throw.
+
+		Params:
+			`permutation` (list[int]): The old index position of each child in the new order.
 		
-		return node
+		- Since: 1.1
+		"""
 
+		c_size: int = len(self._childrens)
 
-	def get_path(self) -> "tuple":
+		if (len(permutation) != c_size):
+			raise Exception("The permutation has {size} indexes instead of {count}.".format(
+				size = len(permutation),
+				count = c_size
+			))
+
+		seen: bytearray = bytearray(c_size)
+
+		for p in permutation:
+
+			if ((isinstance(p, int) == False) or (p < 0) or (p >= c_size) or (seen[p] == 1)):
+				raise Exception("Invalid index '{index}' used in permutation.".format(
+					index = p
+				))
+
+			seen[p] = 1
+
+		childrens: list[TreeNode] = list(self._childrens)
+		self._childrens[:] = [childrens[p] for p in permutation]
+		self.invalidate_aggregates()
+		self._reordered_childrens()
+
+
+	def set_loader(self, loader: Callable[["TreeNode"], object], pool: "LoaderPool" = None) -> None:
 		"""
-		Get the reference of all Nodes between the root Node and the current Node.
+		Let the childrens of the current Node be given by a loader the first time they are used by `childrens`, `get_child`, `len`, iteration or a walk.
 
-		- Since: 1.0
+		The loader receive the current Node and give an iterable of new Nodes or names, a name is converted into a Node of the same class of the current Node.
+		Repeated names get a counter like `rename` does and the virtual methods are executed like with `add_child`.
+
+		If the current Node already has childrens an exception will throw.
+
+		Params:
+			`loader` (callable): The function that give the childrens.
+			`pool` (LoaderPool): Optional pool that unload the least recently used childrens when more Nodes than his budget are loaded.
+
+		- Since: 1.1
 		"""
 
-		path: tuple = ()
-		node: TreeNode = self
+		if (len(self._childrens) > 0):
+			raise Exception("Tried to set a loader on a Node wich already has childrens.")
 
-		while(node.parent != None):
-			node = node.parent
-			path = (node, *path)
-		
-		return path
+		self._childrens = LazyChildList(self, loader, pool)
 
 
-	def get_child_count(self) -> "int":
+	def is_loaded(self) -> "bool":
 		"""
-		Will give the total amount of childrens parented with the current Node.
-		
-		Returns:
-			The size of childrens list.
-		
-		- since: 1.0
+		Check if the childrens of the current Node are available without executing a loader.
+
+		- Since: 1.1
 		"""
-		
-		return len(self._childrens)
 
+		return (isinstance(self._childrens, LazyChildList) == False) or (self._childrens.loaded == True)
 
-	def get_child(self, *path: Union["int", "str"]) -> Union["TreeNode", None]:
+
+	def unload(self) -> None:
 		"""
-		Will find a Node from the current Node (if 1 argoument is used) or travel trought sub-childrens (if more argouments are used).
+		Forget the childrens given by the loader of the current Node, they are asked again to the loader the next time they are used.
 
-		The path allow multiple types to get nodes:
-		- int: The index position inside the list, positive numbers will get the item from the begin to the end and negative numbers will get the item from the end to the begin.
-		- str: The unique name of the node.
+		Any change made to the childrens is lost, the removed Nodes are unparented and the virtual methods are executed like with `remove_child`.
 
-		Params:
-			`path` (int|string)
+		If the current Node has no loader nothing happen.
 
-		Returns:
-			The found Node or `None` if not found.
-		
-		- Since: 1.0
+		- Since: 1.1
 		"""
 
-		current: TreeNode = self
-		node: TreeNode = None
+		if (isinstance(self._childrens, LazyChildList) == True):
+			self._childrens.unload()
 
-		for p in path:
-			
-			if (isinstance(p, int) == True):
-				c_size: int = len(current._childrens)
-				
-				if (p >= 0):
-					if (p > (c_size - 1)):
-						return None
-					else:
-						current = current._childrens[p]
-				
-				else:
-					if (-p > c_size):
-						return None
-					else:
-						current = current._childrens[c_size + p]
-				
-				node = current
-			
-			elif (isinstance(p, str) == True):
-				found: bool = False
 
-				for c in current._childrens:
+	def _load_childrens(self, nodes) -> None:
+		"""
+		Add the Nodes given by a loader as the last childrens of the current Node.
+		"""
 
-					if (c._name == p):
-						found = True
-						current = c
-						node = c
-						break
-				
-				if (found == False):
-					return None
-			
-			else:
-				raise Exception("Invalid type '{type}' used in path.".format(
-					type = type(p).__name__
-				))
+		names: dict[str, int] = {}
 
-		return node
+		for node in nodes:
 
+			if (isinstance(node, str) == True):
+				node = type(self)(node)
 
-	def walk_base(self, inverse: "bool" = False) -> list[NodeWalkIterator]:
-		"""
-		Get all the childrens and sub-childrens from the current Node and give a list of iterators with the path and the target Node of the iteration.
+			if (isinstance(node, TreeNode) == False):
+				raise Exception("The loader gave class type '{type}' instead of '{node}' base class.".format(
+					type = type(node).__name__,
+					node = type(self).__name__
+				))
 
-		It will first get all the childrens before the sub-childrens.
+			if (node._parent != None):
+				raise Exception("The loader gave a Node already parented with a Node.")
 
-		Params:
-			`inverse` (bool): Will invert the iteration from top-down to bottom-up.
-		
-		Returns:
-			List of all iterators.
-		
-		- Since: 1.0
-		"""
+			name: str = node._name
 
-		child_list: list[TreeNode]  = self._childrens if (inverse == False) else self._childrens[::-1]
-		walk: list[NodeWalkIterator] = []
+			if (name in names):
+				count: int = names[name]
 
-		for child in child_list:
-			step: NodeWalkIterator = NodeWalkIterator([self], child)
-			walk.append(step)
+				while(True):
+					count += 1
+					fix_name: str = f"{name}{count}"
 
-		for child in child_list:
+					if ((fix_name in names) == False):
+						break
 
-			for iter in child.walk_base(inverse = inverse):
-				iter.path.append(self)
-				walk.append(iter)
+				names[name] = count
+				name = fix_name
 
-		return walk
-	
+			names[name] = 0
+			node._name = name
+			node._parent = self
+			self._childrens.append(node)
+			node._renamed()
+			node._changed_parent()
+			self._add_child(node)
 
-	def walk_tree(self, inverse: "bool" = False) -> list[NodeWalkIterator]:
+		self.invalidate_aggregates()
+
+
+	def _unload_childrens(self, nodes: "list[TreeNode]") -> None:
+		"""
+		Unparent the Nodes forgotten by the loader of the current Node.
 		"""
-		Get all the childrens and sub-childrens from the current Node and give a list of iterators with the path and the target Node of the iteration.
 
-		It will get childrens and sub-childrens sequencially.
+		self.invalidate_aggregates()
 
-		Params:
+		for node in nodes:
+			node._parent = None
+			node._changed_parent()
+			self._removed_child(node)
+
+
+	@classmethod
+	def register_aggregate(cls, name: "str", leaf_fn: Callable[["TreeNode"], object], combine_fn: Callable[[object, list], object]) -> None:
+		"""
+		Register a value computed for each Node from his own value and the values of his childrens, like totals, maximums or hashes.
+
+		The value of a Node is `combine_fn(leaf_fn(node), [values of the childrens])`, it is computed only when requested with `get_aggregate` and kept until the subtree change.
+
+		The aggregate is available to the current class and his subclasses.
+
+		Params:
+			`name` (str): The name used to request the aggregate.
+			`leaf_fn` (callable): Give the own value of a Node.
+			`combine_fn` (callable): Combine the own value of a Node with the list of values of his childrens.
+
+		- Since: 1.1
+		"""
+
+		if (("_aggregate_reducers" in cls.__dict__) == False):
+			cls._aggregate_reducers = dict(cls._aggregate_reducers)
+
+		cls._aggregate_reducers[name] = (leaf_fn, combine_fn)
+
+
+	def invalidate_aggregates(self) -> None:
+		"""
+		Mark the aggregates of the current Node and of his parents as outdated, they are computed again the next time they are requested.
+
+		It is executed automatically when the tree is changed or a Node is renamed, call it when a subclass change a state used by a leaf function.
+
+		- Since: 1.1
+		"""
+
+		node: TreeNode = self
+
+		# A Node can have aggregates only if all his childrens have them, so the first Node without them stop the walk.
+		while((node != None) and (node._aggregate_cache != None)):
+			node._aggregate_cache = None
+			node = node._parent
+
+
+	def get_aggregate(self, name: "str") -> object:
+		"""
+		Get the value of an aggregate registered with `register_aggregate` for the subtree of the current Node.
+
+		Only the Nodes changed since the last request, and their parents, are computed again.
+
+		Params:
+			`name` (str): The name of the aggregate.
+
+		Returns:
+			The value of the aggregate.
+
+		- Since: 1.1
+		"""
+
+		if ((self._aggregate_cache != None) and (name in self._aggregate_cache)):
+			return self._aggregate_cache[name]
+
+		if ((name in self._aggregate_reducers) == False):
+			raise Exception("The aggregate '{name}' is not registered.".format(
+				name = name
+			))
+
+		leaf_fn, combine_fn = self._aggregate_reducers[name]
+		stack: list[tuple[TreeNode, bool]] = [(self, False)]
+
+		# Unloading a visited subtree would remove the values needed by his parent.
+		with LoaderPool.hold():
+
+			while(len(stack) > 0):
+				node, ready = stack.pop()
+
+				if (ready == True):
+					value: object = combine_fn(leaf_fn(node), [child._aggregate_cache[name] for child in node._childrens])
+
+					if (node._aggregate_cache == None):
+						node._aggregate_cache = {}
+
+					node._aggregate_cache[name] = value
+					continue
+
+				stack.append((node, True))
+
+				for child in node._childrens:
+
+					if ((child._aggregate_cache == None) or ((name in child._aggregate_cache) == False)):
+						stack.append((child, False))
+
+			# The pools are trimmed when the hold end, the value is taken before it can be invalidated.
+			return self._aggregate_cache[name]
+
+
+	def get_hash(self) -> "bytes":
+		"""
+		Get the structure hash of the current Node, it combine his name, the state given by `_hash_state` and the hashes of the childrens in order.
+
+		Two subtrees with the same hash have the same structure, so they can be compared without walking them.
+		The hash is kept until the subtree change, after a change only the changed Nodes and their parents are hashed again.
+
+		Returns:
+			The 16 bytes digest.
+
+		- Since: 1.1
+		"""
+
+		return self.get_aggregate("structure_hash")
+
+
+	def is_same_tree(self, node: "TreeNode") -> "bool":
+		"""
+		Check if the subtree of the input Node has the same structure of the subtree of the current Node by comparing their hashes.
+
+		- Since: 1.1
+		"""
+
+		return self.get_hash() == node.get_hash()
+
+
+	def get_duplicates(self) -> list[list["TreeNode"]]:
+		"""
+		Find the groups of Nodes with the same structure hash inside the childrens and sub-childrens of the current Node.
+
+		The Nodes inside a duplicated subtree don't make a group of their own,
+		but a group found outside of them also contain the matching Nodes inside them.
+
+		Returns:
+			A list of groups, each group contain at least 2 Nodes in preorder.
+
+		- Since: 1.1
+		"""
+
+		self.get_hash()
+		members: dict[bytes, list[TreeNode]] = {}
+		stack: list[TreeNode] = list(reversed(self._childrens))
+
+		while(len(stack) > 0):
+			node: TreeNode = stack.pop()
+			members.setdefault(node._aggregate_cache["structure_hash"], []).append(node)
+			stack.extend(reversed(node._childrens))
+
+		# The subtree of a duplicated Node is not visited, so only the groups with a Node outside of it are reported.
+		groups: dict[bytes, list[TreeNode]] = {}
+		stack = list(reversed(self._childrens))
+
+		while(len(stack) > 0):
+			node = stack.pop()
+			digest: bytes = node._aggregate_cache["structure_hash"]
+
+			if (len(members[digest]) > 1):
+				groups[digest] = members[digest]
+			else:
+				stack.extend(reversed(node._childrens))
+
+		return list(groups.values())
+
+
+	# -------------------------------------------------
+
+
+	def get_index(self) -> "int":
+		"""
+		Get the index position inside the parent list of the current Node.
+		
+		Returns:
+			The index position of the curret Node or `NODE_NO_INDEX` if no parent exist.
+		
+		- Since: 1.0
+		"""
+		
+		return NODE_NO_INDEX if (self._parent == None) else self._parent._childrens.index(self)
+
+
+	def get_root(self) -> "TreeNode":
+		"""
+		Will get the top-level Node wich is parented with all the Nodes of the current tree.
+
+		- Since: 1.0
+		"""
+
+		node: TreeNode = self
+
+		while(node._parent != None):
+			node = node._parent
+		
+		return node
+
+
+	def get_path(self) -> "tuple":
+		"""
+		Get the reference of all Nodes between the root Node and the current Node.
+
+		- Since: 1.0
+		"""
+
+		path: tuple = ()
+		node: TreeNode = self
+
+		while(node.parent != None):
+			node = node.parent
+			path = (node, *path)
+		
+		return path
+
+
+	def get_cursor(self) -> "TreeCursor":
+		"""
+		Create a `TreeCursor` that point to the current Node.
+
+		- Since: 1.1
+		"""
+
+		return TreeCursor(self)
+
+
+	def get_child_count(self) -> "int":
+		"""
+		Will give the total amount of childrens parented with the current Node.
+		
+		Returns:
+			The size of childrens list.
+		
+		- since: 1.0
+		"""
+		
+		return len(self._childrens)
+
+
+	def get_child(self, *path: Union["int", "str"]) -> Union["TreeNode", None]:
+		"""
+		Will find a Node from the current Node (if 1 argoument is used) or travel trought sub-childrens (if more argouments are used).
+
+		The path allow multiple types to get nodes:
+		- int: The index position inside the list, positive numbers will get the item from the begin to the end and negative numbers will get the item from the end to the begin.
+		- str: The unique name of the node.
+
+		Params:
+			`path` (int|string)
+
+		Returns:
+			The found Node or `None` if not found.
+		
+		- Since: 1.0
+		"""
+
+		current: TreeNode = self
+		node: TreeNode = None
+
+		for p in path:
+			
+			if (isinstance(p, int) == True):
+				c_size: int = len(current._childrens)
+				
+				if (p >= 0):
+					if (p > (c_size - 1)):
+						return None
+					else:
+						current = current._childrens[p]
+				
+				else:
+					if (-p > c_size):
+						return None
+					else:
+						current = current._childrens[c_size + p]
+				
+				node = current
+			
+			elif (isinstance(p, str) == True):
+				found: bool = False
+
+				for c in current._childrens:
+
+					if (c._name == p):
+						found = True
+						current = c
+						node = c
+						break
+				
+				if (found == False):
+					return None
+			
+			else:
+				raise Exception("Invalid type '{type}' used in path.".format(
+					type = type(p).__name__
+				))
+
+		return node
+
+
+	def walk_base(self, inverse: "bool" = False) -> list[NodeWalkIterator]:
+		"""
+		Get all the childrens and sub-childrens from the current Node and give a list of iterators with the path and the target Node of the iteration.
+
+		It will first get all the childrens before the sub-childrens.
+
+		Params:
+			`inverse` (bool): Will invert the iteration from top-down to bottom-up.
+		
+		Returns:
+			List of all iterators.
+		
+		- Since: 1.0
+		"""
+
+		child_list: list[TreeNode]  = self._childrens if (inverse == False) else self._childrens[::-1]
+		walk: list[NodeWalkIterator] = []
+
+		for child in child_list:
+			step: NodeWalkIterator = NodeWalkIterator([self], child)
+			walk.append(step)
+
+		for child in child_list:
+
+			for iter in child.walk_base(inverse = inverse):
+				iter.path.append(self)
+				walk.append(iter)
+
+		return walk
+	
+
+	def walk_tree(self, inverse: "bool" = False) -> list[NodeWalkIterator]:
+		"""
+		Get all the childrens and sub-childrens from the current Node and give a list of iterators with the path and the target Node of the iteration.
+
+		It will get childrens and sub-childrens sequencially.
+
+		Params:
 			`inverse` (bool): Will invert the iteration from top-down to bottom-up.
 		
 		Returns:
@@ -556,16 +1107,131 @@ class TreeNode():
 		child_list: list[TreeNode]  = self._childrens if (inverse == False) else self._childrens[::-1]
 		walk: list[NodeWalkIterator] = []
 
-		for child in child_list:
-			step: NodeWalkIterator = NodeWalkIterator([self], child)
-			walk.append(step)
-			
-			for iter in child.walk_tree(inverse = inverse):
-				iter.path.append(self)
-				walk.append(iter)
+		for child in child_list:
+			step: NodeWalkIterator = NodeWalkIterator([self], child)
+			walk.append(step)
+			
+			for iter in child.walk_tree(inverse = inverse):
+				iter.path.append(self)
+				walk.append(iter)
+
+		return walk
+	
+
+	def iter_events(self) -> tuple["int", "str"]:
+		"""
+		Lazily iterate the childrens and sub-childrens of the current Node as `(depth, name)` events, the childrens have depth 0.
+
+		The events are given in the same order used by `walk_tree`, so they can be given back to a `TreeBuilder` to rebuild the tree.
+
+		- Since: 1.1
+		"""
+
+		stack: list = [iter(self._childrens)]
+
+		while(len(stack) > 0):
+			node: TreeNode = next(stack[-1], None)
+
+			if (node == None):
+				stack.pop()
+				continue
+
+			yield (len(stack) - 1, node._name)
+
+			if (len(node._childrens) > 0):
+				stack.append(iter(node._childrens))
+
+
+	def visit(self, fn: Callable[["TreeNode", "int"], "int"], order: "str" = "pre", max_depth: "int" = None) -> Union["TreeNode", None]:
+		"""
+		Will call `fn(node, depth)` on the childrens and sub-childrens of the current Node, the childrens have depth 1.
+
+		Unlike the walk methods the traversal is lazy, only the Nodes that are actually reached are touched.
+
+		The callback can return:
+		- `NODE_VISIT_SKIP`: The childrens of the Node are not visited, ignored by the "post" order because they are already visited.
+		- `NODE_VISIT_STOP`: The traversal end immediately.
+		- Anything else: The traversal continue.
+
+		Params:
+			`fn` (callable): The function called for each visited Node.
+			`order` (str): "pre" to visit a Node before his childrens, "post" to visit it after his childrens, "level" to visit all the Nodes of a depth before the next one.
+			`max_depth` (int): Optional maximum depth to reach, by default there is no limit.
+
+		Returns:
+			The Node that stopped the traversal or `None` if the traversal has been completed.
+
+		- Since: 1.1
+		"""
+
+		if (max_depth == None):
+			max_depth = -1
+		elif (max_depth < 1):
+			return None
+
+		if (order == "pre"):
+			stack: list = [(iter(self._childrens), 1)]
+
+			while(len(stack) > 0):
+				childrens, depth = stack[-1]
+				node: TreeNode = next(childrens, None)
+
+				if (node == None):
+					stack.pop()
+					continue
+
+				result = fn(node, depth)
+
+				if (result == NODE_VISIT_STOP):
+					return node
+
+				if ((result != NODE_VISIT_SKIP) and (depth != max_depth) and (len(node._childrens) > 0)):
+					stack.append((iter(node._childrens), depth + 1))
+
+		elif (order == "post"):
+			stack: list = [(self, iter(self._childrens), 0)]
+
+			while(len(stack) > 0):
+				parent, childrens, depth = stack[-1]
+				node: TreeNode = next(childrens, None)
+
+				if (node != None):
+
+					if ((depth + 1 != max_depth) and (len(node._childrens) > 0)):
+						stack.append((node, iter(node._childrens), depth + 1))
+					else:
+						if (fn(node, depth + 1) == NODE_VISIT_STOP):
+							return node
+
+					continue
+
+				stack.pop()
+
+				if ((depth > 0) and (fn(parent, depth) == NODE_VISIT_STOP)):
+					return parent
+
+		elif (order == "level"):
+			queue: deque = deque([(iter(self._childrens), 1)])
+
+			while(len(queue) > 0):
+				childrens, depth = queue.popleft()
+
+				for node in childrens:
+					result = fn(node, depth)
+
+					if (result == NODE_VISIT_STOP):
+						return node
+
+					if ((result != NODE_VISIT_SKIP) and (depth != max_depth) and (len(node._childrens) > 0)):
+						queue.append((iter(node._childrens), depth + 1))
+
+		else:
+			raise Exception("Invalid order '{order}' used in visit.".format(
+				order = order
+			))
+
+		return None
 
-		return walk
-	
 
 	def repr(self) -> "str":
 		"""
@@ -629,5 +1295,483 @@ class TreeNode():
 		return string
 
 
+def _hash_leaf(node: "TreeNode") -> "bytes":
+	return blake2b(node._name.encode("utf-8") + b"\0" + node._hash_state(), digest_size = 16).digest()
+
+
+def _hash_combine(leaf: "bytes", childrens: list["bytes"]) -> "bytes":
+	digest = blake2b(leaf, digest_size = 16)
+
+	for child in childrens:
+		digest.update(child)
+
+	return digest.digest()
+
+
+TreeNode.register_aggregate("structure_hash", _hash_leaf, _hash_combine)
+
+
+# -------------------------------------------------
+
+
+class TreeBuilder():
+	"""
+	Build a tree from a stream of `(depth, name)` events, like the lines of an indented listing.
+
+	The builder keep the path of the last added Node, so each event is added in constant time without searching the parent.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, root: "TreeNode" = None, unique: "bool" = False, node_type: type = TreeNode) -> None:
+		"""
+		Params:
+			`root` (TreeNode): Optional Node wich will receive the events with depth 0, by default a new Node of `node_type` is created.
+			`unique` (bool): Declare that the events never repeat a name under the same parent, so names are used as they are.
+			`node_type` (type): The class of the Nodes created by `feed`.
+		"""
+
+		if (root == None):
+			root = node_type()
+
+		self._root: TreeNode = root
+		self._unique: bool = unique
+		self._node_type: type = node_type
+		self._stack: list[TreeNode] = [root]
+		self._names: list[dict[str, int]] = [self._used_names(root)]
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def root(self) -> "TreeNode":
+		"""
+		The Node wich receive the events with depth 0.
+
+		- Since: 1.1
+		"""
+
+		return self._root
+
+
+	# -------------------------------------------------
+
+
+	def _used_names(self, node: "TreeNode") -> Union[dict[str, int], None]:
+		"""
+		Get the names already used by the childrens of node with their last counter, `None` if names are declared unique.
+		"""
+
+		if (self._unique == True):
+			return None
+
+		return {child._name: 0 for child in node._childrens}
+
+
+	def feed(self, depth: "int", name: "str", **attrs) -> "TreeNode":
+		"""
+		Create a new Node and add it as the last child of the last Node fed with `depth - 1`, or of the root if depth is 0.
+
+		If the name is already used by another child a counter is added to it like `rename` does, unless the builder has been declared unique.
+
+		The virtual methods are executed like with `add_child`.
+
+		Params:
+			`depth` (int): The depth of the new Node, it can't be greater than the depth of the last Node plus one.
+			`name` (str): The name of the new Node.
+			`attrs`: Extra argouments given to the class of the new Node.
+
+		Returns:
+			The new Node.
+
+		- Since: 1.1
+		"""
+
+		if ((depth < 0) or (depth >= len(self._stack))):
+			raise Exception("Invalid depth '{depth}' after a Node with depth '{last}'.".format(
+				depth = depth,
+				last = len(self._stack) - 2
+			))
+
+		del self._stack[depth + 1:]
+		del self._names[depth + 1:]
+
+		parent: TreeNode = self._stack[depth]
+
+		if (self._unique == False):
+			names: Union[dict[str, int], None] = self._names[depth]
+
+			# Nodes created by the builder start without childrens, so their names are collected only when needed.
+			if (names == None):
+				names = {}
+				self._names[depth] = names
+
+			if (name in names):
+				count: int = names[name]
+
+				while(True):
+					count += 1
+					fix_name: str = f"{name}{count}"
+
+					if ((fix_name in names) == False):
+						break
+
+				names[name] = count
+				name = fix_name
+
+			names[name] = 0
+
+		node: TreeNode = self._node_type(name = name, **attrs)
+		node._name = name
+		node._parent = parent
+		parent._childrens.append(node)
+		parent.invalidate_aggregates()
+		self._stack.append(node)
+		self._names.append(None)
+
+		node._renamed()
+		node._changed_parent()
+		parent._add_child(node)
+		return node
+
+
+# -------------------------------------------------
+
+
+def build_from_events(events, root: "TreeNode" = None, unique: "bool" = False, node_type: type = TreeNode) -> "TreeNode":
+	"""
+	Build a tree from an iterable of `(depth, name)` or `(depth, name, attrs)` events using a `TreeBuilder`.
+
+	The events are read one at a time, so they can come from a generator without keeping the source in memory.
+
+	Params:
+		`events` (iterable): The events to add.
+		`root` (TreeNode): Optional Node wich will receive the events with depth 0.
+		`unique` (bool): Declare that the events never repeat a name under the same parent.
+		`node_type` (type): The class of the Nodes created.
+
+	Returns:
+		The root of the tree.
+
+	- Since: 1.1
+	"""
+
+	builder: TreeBuilder = TreeBuilder(root, unique, node_type)
+
+	for event in events:
+
+		if (len(event) > 2):
+			builder.feed(event[0], event[1], **event[2])
+		else:
+			builder.feed(event[0], event[1])
+
+	return builder.root
+
+
+# -------------------------------------------------
+
+
+class TreeCursor():
+	"""
+	A movable position inside a tree that remember the index and the depth of the Node it point to.
+
+	The index of each Node passed while going down is kept, so moving between siblings and going back up never search the childrens list.
+	Before being used a remembered index is checked against the childrens list, if the tree has been changed by other code the index is searched again.
+	The depth is checked against the parent of the Node and counted again if other code moved the Node to another parent,
+	a Node moved by other code above that parent is not noticed, use a new cursor after such changes.
+
+	The moving methods return `True` when the cursor moved or `False` when the destination does not exist, in that case the cursor stay where it is.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, node: "TreeNode") -> None:
+
+		if (isinstance(node, TreeNode) == False):
+			raise Exception("Tried to use class type '{type}' instead of 'TreeNode' base class.".format(
+				type = type(node).__name__
+			))
+
+		self._node: TreeNode = node
+		self._index: int = node.get_index()
+		self._depth: int = len(node.get_path())
+		self._indexes: list[int] = []
+		self._above: Union[TreeNode, None] = node._parent
+
+
+	def __repr__(self) -> "str":
+		return "<{cursor_class}:{depth}:{index}:{node}>".format(
+			cursor_class = type(self).__name__,
+			depth = self.depth,
+			index = self.index,
+			node = self._node.repr()
+		)
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def node(self) -> "TreeNode":
+		"""
+		The Node the cursor point to.
+
+		- Since: 1.1
+		"""
+
+		return self._node
+
+
+	@property
+	def index(self) -> "int":
+		"""
+		The index position of the Node inside the parent childrens or `NODE_NO_INDEX` if no parent exist.
+
+		- Since: 1.1
+		"""
+
+		parent: Union[TreeNode, None] = self._node._parent
+
+		if (parent == None):
+			return NODE_NO_INDEX
+
+		self._index = self._find(parent, self._node, self._index)
+		return self._index
+
+
+	@property
+	def depth(self) -> "int":
+		"""
+		The amount of Nodes between the root and the Node the cursor point to, the root has depth 0.
+
+		- Since: 1.1
+		"""
+
+		self._check_depth()
+		return self._depth
+
+
+	# -------------------------------------------------
+
+
+	def _check_depth(self) -> None:
+		"""
+		Count the depth again if the Node has been moved to another parent by other code, the indexes passed are no longer of his ancestors.
+		"""
+
+		if (self._node._parent != self._above):
+			self._depth = len(self._node.get_path())
+			self._indexes.clear()
+			self._above = self._node._parent
+
+
+	def _find(self, parent: "TreeNode", node: "TreeNode", index: "int") -> "int":
+		"""
+		Give index when it is still the position of node inside parent, otherwise search it again.
+		"""
+
+		childrens = parent._childrens
+
+		if ((0 <= index < len(childrens)) and (childrens[index] is node)):
+			return index
+
+		return childrens.index(node)
+
+
+	def _move(self, node: "TreeNode", index: "int") -> "bool":
+		self._node = node
+		self._index = index
+		self._above = node._parent
+		return True
+
+
+	# -------------------------------------------------
+
+
+	def down(self, index: "int" = 0) -> "bool":
+		"""
+		Move to a child of the current Node.
+
+		Params:
+			`index` (int): The index position of the child, negative numbers start from the end.
+
+		- Since: 1.1
+		"""
+
+		self._check_depth()
+		childrens = self._node._childrens
+		c_size: int = len(childrens)
+
+		if (index < 0):
+			index += c_size
+
+		if ((index < 0) or (index >= c_size)):
+			return False
+
+		self._indexes.append(self._index)
+		self._depth += 1
+		return self._move(childrens[index], index)
+
+
+	def up(self) -> "bool":
+		"""
+		Move to the parent of the current Node.
+
+		- Since: 1.1
+		"""
+
+		self._check_depth()
+		parent: Union[TreeNode, None] = self._node._parent
+
+		if (parent == None):
+			return False
+
+		return self._climb(parent)
+
+
+	def _climb(self, parent: "TreeNode") -> "bool":
+		"""
+		Move to the parent of the last Node the cursor pointed to.
+		"""
+
+		# Above the Node the cursor started from the index is not known yet.
+		if (len(self._indexes) > 0):
+			index: int = self._indexes.pop()
+			grand_parent: Union[TreeNode, None] = parent._parent
+			index = NODE_NO_INDEX if (grand_parent == None) else self._find(grand_parent, parent, index)
+		else:
+			index = parent.get_index()
+
+		self._depth -= 1
+		return self._move(parent, index)
+
+
+	def next_sibling(self) -> "bool":
+		"""
+		Move to the Node after the current Node inside the parent childrens.
+
+		- Since: 1.1
+		"""
+
+		self._check_depth()
+		parent: Union[TreeNode, None] = self._node._parent
+
+		if (parent == None):
+			return False
+
+		index: int = self.index + 1
+
+		if (index >= len(parent._childrens)):
+			return False
+
+		return self._move(parent._childrens[index], index)
+
+
+	def prev_sibling(self) -> "bool":
+		"""
+		Move to the Node before the current Node inside the parent childrens.
+
+		- Since: 1.1
+		"""
+
+		self._check_depth()
+		parent: Union[TreeNode, None] = self._node._parent
+
+		if (parent == None):
+			return False
+
+		index: int = self.index - 1
+
+		if (index < 0):
+			return False
+
+		return self._move(parent._childrens[index], index)
+
+
+	def insert_before(self, node: "TreeNode") -> None:
+		"""
+		Add the input Node as a sibling before the current Node with `add_child`, the cursor does not move.
+
+		If the current Node has no parent an exception will throw.
+
+		- Since: 1.1
+		"""
+
+		self._parent_of_cursor().add_child(node, self.index)
+		self._index += 1
+
+
+	def insert_after(self, node: "TreeNode") -> None:
+		"""
+		Add the input Node as a sibling after the current Node with `add_child`, the cursor does not move.
+
+		If the current Node has no parent an exception will throw.
+
+		- Since: 1.1
+		"""
+
+		self._parent_of_cursor().add_child(node, self.index + 1)
+
+
+	def remove(self) -> "TreeNode":
+		"""
+		Remove the current Node from his parent with `remove_child` and move to the next sibling,
+		or to the previus sibling if it was the last one, or to the parent if it was the only one.
+
+		If the current Node has no parent an exception will throw.
+
+		Returns:
+			The removed Node.
+
+		- Since: 1.1
+		"""
+
+		self._check_depth()
+		parent: TreeNode = self._parent_of_cursor()
+		node: TreeNode = self._node
+		index: int = self.index
+
+		parent.remove_child(node)
+
+		if (index < len(parent._childrens)):
+			self._move(parent._childrens[index], index)
+		elif (index > 0):
+			self._move(parent._childrens[index - 1], index - 1)
+		else:
+			self._climb(parent)
+
+		return node
+
+
+	def _parent_of_cursor(self) -> "TreeNode":
+
+		if (self._node._parent == None):
+			raise Exception("The Node of the cursor is not parented whit a Node.")
+
+		return self._node._parent
+
+
+# -------------------------------------------------
+
+
+class WeakTreeNode(TreeNode, weak_parent = True):
+	"""
+	A `TreeNode` wich store the parent as a weak reference, see `TreeNode.__init_subclass__`.
+
+	- Since: 1.1
+	"""
+
+	pass
+
+
 # -------------------------------------------------
 
@@ -0,0 +1,533 @@
+"""
+Unrolled Chain,
+store a long chain of values inside fixed size blocks.
+
+Values are ordered from a starting position to a final position
+like a `ChainNode` chain, but without a Python object for each link.
+
+- since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+from typing import Any, Iterable, Union
+from itertools import islice
+
+
+# -------------------------------------------------
+
+
+CHAIN_BLOCK_SIZE: "int" = 256
+"""
+The default amount of values stored inside a single block of a `Chain`.
+
+- Since: 1.1
+"""
+
+
+# -------------------------------------------------
+
+
+class Chain():
+	"""
+	A chain of values stored inside fixed size blocks, an unrolled linked list.
+
+	Each value has an absolute position that never change while the value is inside the chain,
+	blocks are found by dividing the absolute position by the block size so values can be appended at both ends and indexed in constant time.
+
+	Values are read as `ChainCursor` objects that offer the same navigation methods of `ChainNode`.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, values: Iterable[Any] = (), block_size: "int" = CHAIN_BLOCK_SIZE) -> None:
+
+		if (block_size < 1):
+			raise Exception("The block size must be at least 1.")
+
+		self._block_size: int = block_size
+		self._blocks: dict[int, list] = {}
+		self._first: int = 0
+		self._stop: int = 0
+		self.extend(values)
+
+
+	def __repr__(self) -> "str":
+		return self.repr()
+
+
+	def __len__(self) -> "int":
+		return self._stop - self._first
+
+
+	def __iter__(self) -> Any:
+		size: int = self._block_size
+		position: int = self._first
+
+		# Read a whole block at a time.
+		while(position < self._stop):
+			block_id, slot = divmod(position, size)
+			end: int = min(size, slot + self._stop - position)
+
+			for value in self._blocks[block_id][slot:end]:
+				yield value
+
+			position += end - slot
+
+
+	def __reversed__(self) -> Any:
+		position: int = self._stop
+
+		while(position > self._first):
+			position -= 1
+			yield self._read(position)
+
+
+	def __getitem__(self, index: "int") -> Any:
+		return self._read(self._absolute(index))
+
+
+	def __setitem__(self, index: "int", value: Any) -> None:
+		self._write(self._absolute(index), value)
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def block_size(self) -> "int":
+		"""
+		The amount of values stored inside a single block.
+
+		- Since: 1.1
+		"""
+
+		return self._block_size
+
+
+	# -------------------------------------------------
+
+
+	def _absolute(self, index: "int") -> "int":
+		"""
+		Convert an index position, negative numbers start from the end, into an absolute position.
+		"""
+
+		length: int = self._stop - self._first
+
+		if (index < 0):
+			index += length
+
+		if ((index < 0) or (index >= length)):
+			raise IndexError("Chain index out of range.")
+
+		return self._first + index
+
+
+	def _read(self, position: "int") -> Any:
+		block_id, slot = divmod(position, self._block_size)
+		return self._blocks[block_id][slot]
+
+
+	def _write(self, position: "int", value: Any) -> None:
+		block_id, slot = divmod(position, self._block_size)
+		block: Union[list, None] = self._blocks.get(block_id)
+
+		if (block == None):
+			block = [None] * self._block_size
+			self._blocks[block_id] = block
+
+		block[slot] = value
+
+
+	def _clear(self, position: "int") -> None:
+		block_id, slot = divmod(position, self._block_size)
+
+		if (self._stop - self._first == 1):
+			self._blocks.clear()
+			return
+
+		self._blocks[block_id][slot] = None
+
+		# The block is released when the removed value was the last one inside it.
+		if ((position == self._first) and (slot == self._block_size - 1)):
+			del self._blocks[block_id]
+		elif ((position == self._stop - 1) and (slot == 0)):
+			del self._blocks[block_id]
+
+
+	# -------------------------------------------------
+
+
+	def append(self, value: Any) -> "ChainCursor":
+		"""
+		Add a value after the end of the chain.
+
+		Returns:
+			The cursor of the new value.
+
+		- Since: 1.1
+		"""
+
+		self._write(self._stop, value)
+		self._stop += 1
+		return ChainCursor(self, self._stop - 1)
+
+
+	def appendleft(self, value: Any) -> "ChainCursor":
+		"""
+		Add a value before the start of the chain.
+
+		Returns:
+			The cursor of the new value.
+
+		- Since: 1.1
+		"""
+
+		self._write(self._first - 1, value)
+		self._first -= 1
+		return ChainCursor(self, self._first)
+
+
+	def extend(self, values: Iterable[Any]) -> None:
+		"""
+		Add all the values after the end of the chain, the blocks are filled a slice at a time.
+
+		- Since: 1.1
+		"""
+
+		size: int = self._block_size
+		values = iter(values)
+
+		while(True):
+			block_id, slot = divmod(self._stop, size)
+			chunk: list = list(islice(values, size - slot))
+
+			if (len(chunk) == 0):
+				break
+
+			block: Union[list, None] = self._blocks.get(block_id)
+
+			if (block == None):
+				block = [None] * size
+				self._blocks[block_id] = block
+
+			block[slot:slot + len(chunk)] = chunk
+			self._stop += len(chunk)
+
+
+	def pop(self) -> Any:
+		"""
+		Remove the value at the end of the chain.
+
+		If the chain is empty an exception will throw.
+
+		Returns:
+			The removed value.
+
+		- Since: 1.1
+		"""
+
+		if (self._stop == self._first):
+			raise IndexError("Pop from an empty chain.")
+
+		value: Any = self._read(self._stop - 1)
+		self._clear(self._stop - 1)
+		self._stop -= 1
+		return value
+
+
+	def popleft(self) -> Any:
+		"""
+		Remove the value at the start of the chain.
+
+		If the chain is empty an exception will throw.
+
+		Returns:
+			The removed value.
+
+		- Since: 1.1
+		"""
+
+		if (self._stop == self._first):
+			raise IndexError("Pop from an empty chain.")
+
+		value: Any = self._read(self._first)
+		self._clear(self._first)
+		self._first += 1
+		return value
+
+
+	def get_node(self, index: "int") -> Union["ChainCursor", None]:
+		"""
+		Get the cursor of a value by his index position.
+
+		Positive numbers will get the value from the start to the end and negative numbers will get the value from the end to the start.
+
+		Returns:
+			The cursor or `None` if the index is outside of the chain.
+
+		- Since: 1.1
+		"""
+
+		length: int = self._stop - self._first
+
+		if (index < 0):
+			index += length
+
+		if ((index < 0) or (index >= length)):
+			return None
+
+		return ChainCursor(self, self._first + index)
+
+
+	def get_start(self) -> Union["ChainCursor", None]:
+		"""
+		The cursor of the first value or `None` if the chain is empty.
+
+		- Since: 1.1
+		"""
+
+		return self.get_node(0)
+
+
+	def get_end(self) -> Union["ChainCursor", None]:
+		"""
+		The cursor of the last value or `None` if the chain is empty.
+
+		- Since: 1.1
+		"""
+
+		return self.get_node(-1)
+
+
+	def repr(self) -> "str":
+		"""
+		Convert the current chain into a string.
+
+		Returns:
+			The string with a rappresentation of the chain.
+
+		- Since: 1.1
+		"""
+
+		return "<{chain_class}:{length}>".format(
+			chain_class = type(self).__name__,
+			length = len(self)
+		)
+
+
+# -------------------------------------------------
+
+
+class ChainCursor():
+	"""
+	A light reference to a value inside a `Chain`, it offer the navigation methods of `ChainNode`.
+
+	The cursor stay valid until his value is removed from the chain.
+
+	- Since: 1.1
+	"""
+
+
+	# -------------------------------------------------
+
+
+	def __init__(self, chain: "Chain", position: "int") -> None:
+		self._chain: Chain = chain
+		self._position: int = position
+
+
+	def __repr__(self) -> "str":
+		return self.repr()
+
+
+	def __eq__(self, other: Any) -> "bool":
+		return (isinstance(other, ChainCursor) == True) and (other._chain == self._chain) and (other._position == self._position)
+
+
+	def __hash__(self) -> "int":
+		return hash((id(self._chain), self._position))
+
+
+	def __iter__(self) -> "ChainCursor":
+		return self.iter_forward()
+
+
+	def __len__(self) -> "int":
+		return len(self._chain)
+
+
+	# -------------------------------------------------
+
+
+	@property
+	def chain(self) -> "Chain":
+		"""
+		The chain where the value is stored.
+
+		- Since: 1.1
+		"""
+
+		return self._chain
+
+
+	@property
+	def value(self) -> Any:
+		"""
+		The value the cursor point to.
+
+		- Since: 1.1
+		"""
+
+		self._check()
+		return self._chain._read(self._position)
+
+
+	@value.setter
+	def value(self, value: Any) -> None:
+		self._check()
+		self._chain._write(self._position, value)
+
+
+	@property
+	def parent(self) -> Union["ChainCursor", None]:
+		"""
+		The cursor of the previus value or `None` if the current value is the start.
+
+		- Since: 1.1
+		"""
+
+		self._check()
+		return None if (self._position == self._chain._first) else ChainCursor(self._chain, self._position - 1)
+
+
+	@property
+	def child(self) -> Union["ChainCursor", None]:
+		"""
+		The cursor of the next value or `None` if the current value is the end.
+
+		- Since: 1.1
+		"""
+
+		self._check()
+		return None if (self._position == self._chain._stop - 1) else ChainCursor(self._chain, self._position + 1)
+
+
+	# -------------------------------------------------
+
+
+	def _check(self) -> None:
+		"""
+		Make sure the value of the cursor is still inside the chain.
+		"""
+
+		if ((self._position < self._chain._first) or (self._position >= self._chain._stop)):
+			raise Exception("The value of the cursor has been removed from the chain.")
+
+
+	# -------------------------------------------------
+
+
+	def get_index(self) -> "int":
+		"""
+		Get the index position inside the chain from the start to the current position.
+
+		- Since: 1.1
+		"""
+
+		self._check()
+		return self._position - self._chain._first
+
+
+	def get_start(self) -> "ChainCursor":
+		"""
+		The cursor of the first value of the chain.
+
+		- Since: 1.1
+		"""
+
+		return self._chain.get_start()
+
+
+	def get_end(self) -> "ChainCursor":
+		"""
+		The cursor of the last value of the chain.
+
+		- Since: 1.1
+		"""
+
+		return self._chain.get_end()
+
+
+	def get_node(self, index: "int") -> Union["ChainCursor", None]:
+		"""
+		Get the cursor of a value by his index position inside the whole chain.
+
+		- Since: 1.1
+		"""
+
+		return self._chain.get_node(index)
+
+
+	def get_chain(self, index: "int") -> Union["ChainCursor", None]:
+		"""
+		Get the cursor of a value relative from the current value, positive numbers move forward and negative numbers move backward.
+
+		- Since: 1.1
+		"""
+
+		return self._chain.get_node(self.get_index() + index) if (self.get_index() + index >= 0) else None
+
+
+	def iter_forward(self) -> "ChainCursor":
+		"""
+		Lazily iterate the cursors from the next value to the last value.
+
+		- Since: 1.1
+		"""
+
+		self._check()
+
+		for position in range(self._position + 1, self._chain._stop):
+			yield ChainCursor(self._chain, position)
+
+
+	def iter_backward(self) -> "ChainCursor":
+		"""
+		Lazily iterate the cursors from the previus value to the first value.
+
+		- Since: 1.1
+		"""
+
+		self._check()
+
+		for position in range(self._position - 1, self._chain._first - 1, -1):
+			yield ChainCursor(self._chain, position)
+
+
+	def repr(self) -> "str":
+		"""
+		Convert the current cursor into a string.
+
+		Returns:
+			The string with a rappresentation of the cursor.
+
+		- Since: 1.1
+		"""
+
+		return "<{cursor_class}:{index}:{value}>".format(
+			cursor_class = type(self).__name__,
+			index = self.get_index(),
+			value = repr(self.value)
+		)
+
+
+# -------------------------------------------------
+
@@ -0,0 +1,181 @@
+# -------------------------------------------------
+
+
+import sys
+import random
+import threading
+import time
+import unittest
+
+from nodeclass.threadsafe import ThreadSafeTreeNode
+
+
+# -------------------------------------------------
+
+
+_GIL_ENABLED: bool = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+_JOIN_TIMEOUT: float = 60.0
+
+
+# -------------------------------------------------
+
+
+class ThreadSafeTreeNodeTest(unittest.TestCase):
+	"""
+	Stress the locks of `ThreadSafeTreeNode`, the threads change the same nodes so the retry loops of `rename`, `move` and `_detach` are used.
+	"""
+
+
+	def setUp(self) -> None:
+		self._interval: float = sys.getswitchinterval()
+
+		# Switching threads as often as possible make the races happen inside a short test.
+		sys.setswitchinterval(1e-6)
+
+
+	def tearDown(self) -> None:
+		sys.setswitchinterval(self._interval)
+
+
+	# -------------------------------------------------
+
+
+	def _run_threads(self, target, count: "int") -> None:
+		threads: list[threading.Thread] = [threading.Thread(target = target, args = (n,)) for n in range(count)]
+
+		for thread in threads:
+			thread.start()
+
+		for thread in threads:
+			thread.join(_JOIN_TIMEOUT)
+
+		# A thread still running after the timeout is waiting for a lock in a cycle.
+		self.assertFalse(any(thread.is_alive() for thread in threads), "The threads are deadlocked.")
+
+
+	def _check_tree(self, root: "ThreadSafeTreeNode", nodes: list["ThreadSafeTreeNode"]) -> None:
+
+		for group in root:
+			names: list[str] = [child.name for child in group]
+			self.assertEqual(len(names), len(set(names)), "Two childrens use the same name.")
+
+			for child in group:
+				self.assertIs(child.parent, group)
+
+		for node in nodes:
+
+			if (node.parent != None):
+				self.assertIn(node, list(node.parent))
+
+
+	def _stress(self, thread_count: "int", steps: "int") -> None:
+		root: ThreadSafeTreeNode = ThreadSafeTreeNode("root")
+		groups: list[ThreadSafeTreeNode] = [ThreadSafeTreeNode("group") for n in range(4)]
+		nodes: list[ThreadSafeTreeNode] = [ThreadSafeTreeNode("node") for n in range(64)]
+		errors: list[Exception] = []
+
+		for group in groups:
+			root.add_child(group)
+
+		def worker(seed: "int") -> None:
+			rnd: random.Random = random.Random(seed)
+
+			for n in range(steps):
+				node: ThreadSafeTreeNode = rnd.choice(nodes)
+				group: ThreadSafeTreeNode = rnd.choice(groups)
+				action: float = rnd.random()
+
+				try:
+
+					if (action < 0.35):
+						group.add_child(node)
+					elif (action < 0.55):
+						node.remove()
+					elif (action < 0.7):
+						node.rename(rnd.choice(("a", "b", "node")))
+					elif (action < 0.85):
+						node.move(rnd.randint(-2, 2))
+					else:
+						# Move between two parents in both directions, the locks are still taken from parent to child.
+						other: ThreadSafeTreeNode = rnd.choice(groups)
+
+						with group.locked():
+
+							if (node.parent == group):
+								group.remove_child(node)
+								other.add_child(node)
+
+				except Exception as error:
+
+					# The node has been parented or unparented by another thread meanwhile.
+					if (("already parented" in str(error)) or ("not parented" in str(error)) or ("isn't connected" in str(error))):
+						continue
+
+					errors.append(error)
+
+		self._run_threads(worker, thread_count)
+		self.assertEqual(errors, [])
+		self._check_tree(root, nodes)
+
+
+	# -------------------------------------------------
+
+
+	def test_concurrent_changes(self) -> None:
+		self._stress(8, 400)
+
+
+	@unittest.skipIf(_GIL_ENABLED == True, "A free-threaded build of Python is required.")
+	def test_concurrent_changes_without_gil(self) -> None:
+		self._stress(16, 2000)
+
+
+	def test_retry_after_parent_change(self) -> None:
+		old: ThreadSafeTreeNode = ThreadSafeTreeNode("old")
+		new: ThreadSafeTreeNode = ThreadSafeTreeNode("new")
+		new.add_child(ThreadSafeTreeNode("x"))
+		new.add_child(ThreadSafeTreeNode("y"))
+
+		def change(node: "ThreadSafeTreeNode", action) -> None:
+			old.add_child(node)
+			started: threading.Event = threading.Event()
+
+			def waiter(n: "int") -> None:
+				started.set()
+				action(node)
+
+			thread: threading.Thread = threading.Thread(target = waiter, args = (0,))
+
+			# The waiter block on the lock of the old parent, the node is moved to the new parent before it is released.
+			with old.locked():
+				thread.start()
+				started.wait()
+				time.sleep(0.05)
+				node.remove()
+				new.add_child(node)
+
+			thread.join(_JOIN_TIMEOUT)
+			self.assertFalse(thread.is_alive(), "The threads are deadlocked.")
+
+		renamed: ThreadSafeTreeNode = ThreadSafeTreeNode("z")
+		change(renamed, lambda node: node.rename("x"))
+		self.assertIs(renamed.parent, new)
+		self.assertEqual(renamed.name, "x1")
+
+		moved: ThreadSafeTreeNode = ThreadSafeTreeNode("moved")
+		change(moved, lambda node: node.move(0))
+		self.assertIs(new.childrens[0], moved)
+
+		removed: ThreadSafeTreeNode = ThreadSafeTreeNode("removed")
+		change(removed, lambda node: node.remove())
+		self.assertIs(removed.parent, None)
+		self.assertNotIn(removed, list(new))
+		self.assertEqual(len(old), 0)
+
+
+# -------------------------------------------------
+
+
+if (__name__ == "__main__"):
+	unittest.main()